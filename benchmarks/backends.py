@@ -0,0 +1,60 @@
+import timeit
+
+from benchmarks import synthetic
+from src.command import LCOMFactory
+from src.lcom import ClassGraph
+from src.reflection import ModuleReflection
+
+CLASSES = (
+    ('chained', synthetic.chained_class, (1000,)),
+    ('wide', synthetic.wide_class, (1000,)),
+    ('dense', synthetic.dense_class, (500, 500, 16)),
+    ('deep_calls', synthetic.call_chain_class, (1000,)),
+    ('recursive', synthetic.recursive_class, (500,)),
+)
+LARGE = ('chained', synthetic.chained_class, (20000,))
+REPEAT = 3
+
+
+def graph(factory, args):
+    ref = ModuleReflection.from_string('bench', factory('Bench', *args)) \
+        .class_by_name('bench.Bench')
+    return ClassGraph.from_reflection(ref)
+
+
+def measure(graph, backend):
+    lcom = LCOMFactory.create(LCOMFactory.LCOM4, backend)
+    elapsed = min(timeit.repeat(
+        lambda: lcom.measure(graph),
+        number=1,
+        repeat=REPEAT
+    ))
+    return elapsed, lcom.measure(graph)
+
+
+def main():
+    print('%-12s %8s %12s %8s' % ('class', 'backend', 'seconds', 'lcom'))
+    for name, factory, args in CLASSES:
+        scores = set()
+        for backend in LCOMFactory.BACKENDS:
+            elapsed, score = measure(graph(factory, args), backend)
+            scores.add(score)
+            print('%-12s %8s %12.6f %8d' % (name, backend, elapsed, score))
+
+        assert len(scores) == 1, 'Backends disagree on %s' % name
+
+    name, factory, args = LARGE
+    large = graph(factory, args)
+    times = dict()
+    for backend in (LCOMFactory.PYTHON, LCOMFactory.NUMPY):
+        times[backend], score = measure(large, backend)
+        print('%-12s %8s %12.6f %8d' % (
+            'large_' + name, backend, times[backend], score
+        ))
+
+    assert times[LCOMFactory.NUMPY] < times[LCOMFactory.PYTHON], \
+        'The numpy backend is slower than python on large classes'
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import os
+import shutil
+import tempfile
+import time
+import timeit
+
+from benchmarks.synthetic import chained_class, module
+from src.reader import BulkReader
+
+FILES = 200
+LATENCY = 0.002
+THREADS = (1, 4, 16)
+REPEAT = 3
+
+
+def slow_open(path, mode):
+    # Simulates a network file system, where every open pays a round trip.
+    time.sleep(LATENCY)
+    return open(path, mode)
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    try:
+        files = list()
+        for i in range(FILES):
+            file = os.path.join(directory, 'module_%d.py' % i)
+            with open(file, 'w') as handle:
+                handle.write(module(5, chained_class, 10))
+            files.append(file)
+
+        def serial():
+            for file in files:
+                with slow_open(file, 'rb') as handle:
+                    handle.read()
+
+        print('%d files, %.1fms latency per open' % (FILES, LATENCY * 1000))
+        serial_time = min(timeit.repeat(serial, number=1, repeat=REPEAT))
+        print('%10s %10.4fs' % ('serial', serial_time))
+
+        for threads in THREADS:
+            reader = BulkReader(threads, opener=slow_open)
+            elapsed = min(timeit.repeat(
+                lambda: list(reader.read(files)), number=1, repeat=REPEAT
+            ))
+            print('%10s %10.4fs %7.1fx' % (
+                'threads=%d' % threads, elapsed, serial_time / elapsed
+            ))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
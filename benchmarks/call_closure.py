@@ -0,0 +1,40 @@
+import timeit
+
+from benchmarks.synthetic import call_chain_class
+from src.lcom import LCOM4
+from src.reflection import ModuleReflection
+
+DEPTHS = (1000, 2000, 4000)
+MAX_GROWTH = 3.0
+REPEAT = 3
+
+
+def measure(depth, cyclic):
+    module = ModuleReflection.from_string(
+        'bench',
+        call_chain_class('Chain', depth, cyclic)
+    )
+    ref = module.class_by_name('bench.Chain')
+    lcom = LCOM4()
+
+    assert lcom.calculate(ref) == 1
+    return min(timeit.repeat(lambda: lcom.calculate(ref), number=1,
+                             repeat=REPEAT))
+
+
+def main():
+    print('%8s %8s %12s' % ('depth', 'cyclic', 'seconds'))
+    for cyclic in (False, True):
+        times = list()
+        for depth in DEPTHS:
+            times.append(measure(depth, cyclic))
+            print('%8d %8s %12.6f' % (depth, cyclic, times[-1]))
+
+        for depth, before, after in zip(DEPTHS[1:], times, times[1:]):
+            assert after / before < MAX_GROWTH, \
+                'Depth %d is %.1fx slower than half of it, expected linear' \
+                % (depth, after / before)
+
+
+if __name__ == '__main__':
+    main()
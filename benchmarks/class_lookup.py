@@ -0,0 +1,45 @@
+import ast
+import timeit
+
+from benchmarks.synthetic import chained_class, module
+from src.reflection import ClassIndexer, ModuleReflection
+
+CLASSES = 500
+REPEAT = 5
+
+
+def legacy_class_by_name(node, name):
+    # Mirrors the previous ModuleReflection.class_by_name: walk the whole
+    # module again, index every class and scan the result linearly.
+    for elem in ast.walk(node):
+        if isinstance(elem, ast.ClassDef):
+            index = ClassIndexer().index(elem)
+            if 'bench.%s' % index.name == name:
+                return index
+
+
+def main():
+    source = module(CLASSES, chained_class, 10)
+    node = ast.parse(source)
+    ref = ModuleReflection.from_string('bench', source)
+    names = ['bench.Class%d' % i for i in range(0, CLASSES, 10)]
+
+    def legacy():
+        for name in names:
+            legacy_class_by_name(node, name)
+
+    def cached():
+        for name in names:
+            ref.class_by_name(name)
+
+    legacy_time = min(timeit.repeat(legacy, number=1, repeat=REPEAT))
+    cached_time = min(timeit.repeat(cached, number=1, repeat=REPEAT))
+
+    print('%d lookups in a module with %d classes' % (len(names), CLASSES))
+    print('%8s %12.6f' % ('legacy', legacy_time))
+    print('%8s %12.6f' % ('cached', cached_time))
+    print('%8s %12.1fx' % ('speedup', legacy_time / cached_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+import timeit
+
+from benchmarks.synthetic import chained_class
+from src.lcom import LCOM4
+from src.reflection import ModuleReflection
+
+SIZES = (100, 200, 400, 800, 1600)
+REPEAT = 5
+
+
+def measure(methods):
+    module = ModuleReflection.from_string(
+        'bench',
+        chained_class('Chained', methods)
+    )
+    ref = module.class_by_name('bench.Chained')
+    lcom = LCOM4()
+
+    assert lcom.calculate(ref) == 1
+    return min(timeit.repeat(lambda: lcom.calculate(ref), number=1,
+                             repeat=REPEAT))
+
+
+def main():
+    previous = None
+    print('%8s %12s %8s' % ('methods', 'seconds', 'ratio'))
+    for size in SIZES:
+        elapsed = measure(size)
+        ratio = elapsed / previous if previous else 1.0
+        print('%8d %12.6f %8.2f' % (size, elapsed, ratio))
+        previous = elapsed
+
+
+if __name__ == '__main__':
+    main()
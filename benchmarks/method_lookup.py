@@ -0,0 +1,51 @@
+import ast
+import timeit
+
+from benchmarks.synthetic import wide_class
+from src.reflection import ModuleReflection
+
+METHODS = 500
+REPEAT = 5
+
+
+def legacy_method_by_name(node, name):
+    # Mirrors the previous ClassReflection.method_by_name: rebuild the set of
+    # method nodes, filter it linearly and wrap the match in a new object.
+    nodes = [
+        elem
+        for elem in {
+            child
+            for child in node.body
+            if isinstance(child, ast.FunctionDef)
+        }
+        if elem.name == name
+    ]
+    return type('LegacyMethodReflection', (object,), {})(), nodes[0]
+
+
+def main():
+    source = wide_class('Wide', METHODS)
+    node = ast.parse(source).body[0]
+    ref = ModuleReflection.from_string('bench', source) \
+        .class_by_name('bench.Wide')
+    names = ['method_%d' % i for i in range(METHODS)]
+
+    def legacy():
+        for name in names:
+            legacy_method_by_name(node, name)
+
+    def cached():
+        for name in names:
+            ref.method_by_name(name)
+
+    legacy_time = min(timeit.repeat(legacy, number=1, repeat=REPEAT))
+    cached_time = min(timeit.repeat(cached, number=1, repeat=REPEAT))
+
+    print('%d lookups on a class with %d methods' % (METHODS, METHODS))
+    print('%8s %12.6f' % ('legacy', legacy_time))
+    print('%8s %12.6f' % ('cached', cached_time))
+    print('%8s %12.1fx' % ('speedup', legacy_time / cached_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+import ast
+import gc
+import tracemalloc
+
+from benchmarks import synthetic
+from src.reflection import ModuleReflection
+
+MODULES = (50, 200, 800)
+SOURCE = synthetic.module(5, synthetic.dense_class, 20, 40, 6)
+
+
+def retained(factory, modules):
+    gc.collect()
+    tracemalloc.start()
+    kept = [factory('mod_%d' % i) for i in range(modules)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current
+
+
+def main():
+    print('%8s %14s %14s %8s' % ('modules', 'AST KiB', 'records KiB', 'ratio'))
+    for modules in MODULES:
+        trees = retained(lambda name: ast.parse(SOURCE), modules)
+        records = retained(
+            lambda name: ModuleReflection.from_string(name, SOURCE),
+            modules
+        )
+        print('%8d %14.1f %14.1f %7.1fx' % (
+            modules, trees / 1024.0, records / 1024.0,
+            float(trees) / records
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from benchmarks.synthetic import chained_class, module
+from src.command import ModuleScorer
+from src.lcom import LCOM4
+from src.server import Client, ScoreServer, ScoreService
+
+QUERIES = 200
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(directory, 'bench.py'), 'w') as handle:
+            handle.write(module(50, chained_class, 20))
+
+        path = os.path.join(directory, 'lcom.sock')
+        server = ScoreServer(path, ScoreService(
+            LCOM4(), ModuleScorer(LCOM4())
+        ))
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+
+        try:
+            client = Client(path)
+            start = time.time()
+            client.query('bench.py', cwd=directory)
+            cold = time.time() - start
+
+            times = list()
+            for i in range(QUERIES):
+                start = time.time()
+                client.query('bench.py', 'bench.Class%d' % (i % 50),
+                             directory)
+                times.append(time.time() - start)
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+        times.sort()
+        print('%-6s %8.2fms' % ('cold', cold * 1000))
+        print('%-6s %8.2fms' % ('median', times[len(times) // 2] * 1000))
+        print('%-6s %8.2fms' % ('p99', times[int(len(times) * 0.99)] * 1000))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
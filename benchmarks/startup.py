@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+import time
+
+REPEAT = 10
+TOP = 10
+COMMANDS = (
+    ('import', ['-c', 'import src.command']),
+    ('help', ['-c', 'from src.command import main; main()', '--help']),
+    ('score', ['-c', 'from src.command import main; main()',
+               '--printer', 'jsonl', 'src/ignore.py']),
+)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def wall(args):
+    start = time.time()
+    subprocess.check_call(
+        [sys.executable] + args,
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    return time.time() - start
+
+
+def imports(module):
+    # -X importtime (Python 3.7+) lists every import with its cumulative
+    # time in microseconds, nested imports indented by two spaces and
+    # listed before the module importing them.
+    process = subprocess.Popen(
+        [sys.executable, '-X', 'importtime', '-c', 'import %s' % module],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    _, err = process.communicate()
+
+    result = list()
+    children = list()
+    for line in err.decode('utf-8').splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            children.append((int(cumulative), name.strip()))
+        elif depth == 0:
+            if name.strip() == module:
+                result = children
+            children = list()
+    return sorted(result, reverse=True)
+
+
+def main():
+    for name, args in COMMANDS:
+        times = sorted(wall(args) for _ in range(REPEAT))
+        print('%-8s min %7.1fms median %7.1fms' % (
+            name, times[0] * 1000, times[len(times) // 2] * 1000
+        ))
+
+    if sys.version_info < (3, 7):
+        return
+
+    print('\nSlowest imports made by src.command')
+    for cumulative, name in imports('src.command')[:TOP]:
+        print('%10.1fms %s' % (cumulative / 1000.0, name))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+import os
+import shutil
+import tempfile
+import tracemalloc
+
+from benchmarks.synthetic import chained_class
+from src.command import FileSystem, Printer, Runner
+from src.lcom import LCOM4
+
+FILES = (50, 200, 800)
+METHODS = 50
+
+
+class CountingPrinter(Printer):
+    def __init__(self):
+        self.rows = 0
+
+    def start(self, algorithm):
+        self.rows = 0
+
+    def row(self, name, score):
+        self.rows += 1
+
+    def finish(self, average):
+        pass
+
+
+def write_tree(directory, files):
+    source = chained_class('Chained', METHODS)
+    for i in range(files):
+        with open(os.path.join(directory, 'mod_%d.py' % i), 'w') as handle:
+            handle.write(source)
+
+
+def measure(files):
+    directory = tempfile.mkdtemp()
+    try:
+        write_tree(directory, files)
+        printer = CountingPrinter()
+
+        tracemalloc.start()
+        Runner(FileSystem(), LCOM4(), printer).handle([directory])
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert printer.rows == files
+        return peak
+    finally:
+        shutil.rmtree(directory)
+
+
+def main():
+    print('%8s %12s' % ('files', 'peak KiB'))
+    for files in FILES:
+        print('%8d %12.1f' % (files, measure(files) / 1024.0))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+import ast
+import json
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import timeit
+
+import click
+
+from benchmarks import synthetic
+from src.command import FileSystem, Printer, Runner
+from src.lcom import LCOM4
+from src.reflection import ClassReflection, ModuleReflection
+
+SCENARIOS = (
+    ('many_classes', lambda: synthetic.module(
+        500, synthetic.chained_class, 10)),
+    ('many_methods', lambda: synthetic.module(
+        1, synthetic.chained_class, 2000)),
+    ('deep_calls', lambda: synthetic.module(
+        1, synthetic.call_chain_class, 1000)),
+    ('dense_attributes', lambda: synthetic.module(
+        20, synthetic.dense_class, 100, 200, 16)),
+    ('mutual_recursion', lambda: synthetic.module(
+        5, synthetic.recursive_class, 200)),
+)
+STAGES = ('parse', 'methods', 'lcom', 'runner')
+MODULE = 'bench'
+
+
+class NullPrinter(Printer):
+    def start(self, algorithm):
+        pass
+
+    def row(self, name, score):
+        pass
+
+    def finish(self, average):
+        pass
+
+
+class Scenario(object):
+    def __init__(self, source, repeat):
+        self.__source = source
+        self.__repeat = repeat
+
+    def parse(self):
+        return self.__time(
+            lambda: ModuleReflection.from_string(MODULE, self.__source)
+        )
+
+    def methods(self):
+        nodes = [
+            node
+            for node in ast.parse(self.__source).body
+            if isinstance(node, ast.ClassDef)
+        ]
+
+        def extract():
+            for node in nodes:
+                ClassReflection.from_node(MODULE, node).methods()
+
+        return self.__time(extract)
+
+    def lcom(self):
+        refs = ModuleReflection.from_string(MODULE, self.__source).classes()
+        lcom = LCOM4()
+        for ref in refs:
+            ref.methods()
+
+        def calculate():
+            for ref in refs:
+                lcom.calculate(ref)
+
+        return self.__time(calculate)
+
+    def runner(self):
+        directory = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(directory, 'bench.py'), 'w') as handle:
+                handle.write(self.__source)
+
+            runner = Runner(FileSystem(), LCOM4(), NullPrinter())
+            return self.__time(lambda: runner.handle([directory]))
+        finally:
+            shutil.rmtree(directory)
+
+    def __time(self, func):
+        return min(timeit.repeat(func, number=1, repeat=self.__repeat))
+
+
+def revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            stderr=subprocess.PIPE
+        ).decode('utf-8').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(names, repeat):
+    results = dict()
+    for name, factory in SCENARIOS:
+        if names and name not in names:
+            continue
+
+        scenario = Scenario(factory(), repeat)
+        results[name] = {
+            stage: getattr(scenario, stage)()
+            for stage in STAGES
+        }
+        click.echo(
+            '%-18s %s' % (name, ' '.join(
+                '%s=%.4fs' % (stage, results[name][stage])
+                for stage in STAGES
+            )),
+            err=True
+        )
+
+    return {
+        'revision': revision(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def compare(before, after):
+    click.echo('%-18s %-8s %10s %10s %8s' % (
+        'scenario', 'stage', 'before', 'after', 'ratio'
+    ), err=True)
+    for name in sorted(after['results']):
+        if name not in before['results']:
+            continue
+        for stage in STAGES:
+            old = before['results'][name].get(stage)
+            new = after['results'][name].get(stage)
+            if old is None or new is None:
+                continue
+            click.echo('%-18s %-8s %10.4f %10.4f %7.2fx' % (
+                name, stage, old, new, new / old if old else 0
+            ), err=True)
+
+
+@click.command()
+@click.option('--scenario', multiple=True,
+              type=click.Choice([name for name, _ in SCENARIOS]))
+@click.option('--repeat', default=3, type=click.IntRange(min=1))
+@click.option('--output', type=click.File('w'), default='-')
+@click.option('--compare', 'baseline', type=click.File('r'), default=None,
+              help='Results of an earlier run to compare against.')
+def cmd(scenario, repeat, output, baseline):
+    result = run(scenario, repeat)
+    json.dump(result, output, indent=2, sort_keys=True)
+    output.write('\n')
+
+    if baseline is not None:
+        compare(json.load(baseline), result)
+
+
+if __name__ == '__main__':
+    cmd()
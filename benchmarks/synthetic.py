@@ -0,0 +1,82 @@
+import os
+import random
+
+
+def chained_class(name, methods):
+    """Class whose methods share attributes pairwise, forming one chain."""
+    lines = ['class %s(object):' % name]
+    for i in range(methods):
+        lines += [
+            '    def method_%d(self):' % i,
+            '        return self.attr_%d + self.attr_%d' % (i, i + 1),
+            '',
+        ]
+    return os.linesep.join(lines)
+
+
+def call_chain_class(name, depth, cyclic=False):
+    """DeepOne-like class: each method calls the next one in the chain."""
+    lines = ['class %s(object):' % name]
+    for i in range(depth):
+        lines += [
+            '    def method_%d(self):' % i,
+            '        return self.method_%d()' % (i + 1),
+            '',
+        ]
+    last = 'self.method_0()' if cyclic else 'self.attr'
+    lines += [
+        '    def method_%d(self):' % depth,
+        '        return %s' % last,
+        '',
+    ]
+    return os.linesep.join(lines)
+
+
+def wide_class(name, methods):
+    """Class with independent methods, each using its own attribute."""
+    lines = ['class %s(object):' % name]
+    for i in range(methods):
+        lines += [
+            '    def method_%d(self):' % i,
+            '        return self.attr_%d' % i,
+            '',
+        ]
+    return os.linesep.join(lines)
+
+
+def dense_class(name, methods, attributes, shared=8, seed=0):
+    """Class whose methods each read `shared` of `attributes` attributes."""
+    chooser = random.Random(seed)
+    lines = ['class %s(object):' % name]
+    for i in range(methods):
+        used = chooser.sample(range(attributes), min(shared, attributes))
+        lines += [
+            '    def method_%d(self):' % i,
+            '        return %s' % ' + '.join(
+                'self.attr_%d' % attr for attr in sorted(used)
+            ),
+            '',
+        ]
+    return os.linesep.join(lines)
+
+
+def recursive_class(name, methods):
+    """Class whose methods call both neighbours in a ring."""
+    lines = ['class %s(object):' % name]
+    for i in range(methods):
+        lines += [
+            '    def method_%d(self):' % i,
+            '        return self.method_%d() + self.method_%d() + self.x' % (
+                (i + 1) % methods,
+                (i - 1) % methods
+            ),
+            '',
+        ]
+    return os.linesep.join(lines)
+
+
+def module(classes, factory, *args):
+    """Module with `classes` classes built by `factory`."""
+    return (os.linesep * 2).join(
+        factory('Class%d' % i, *args) for i in range(classes)
+    )
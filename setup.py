@@ -24,7 +24,9 @@ setup(
     ],
     install_requires=[
         'click',
-        'terminaltables'
+        'terminaltables',
+        'scandir; python_version < "3.5"',
+        'futures; python_version < "3"',
     ],
     test_suite='tests',
     tests_require=[
@@ -41,6 +43,6 @@ setup(
         'License :: OSI Approved :: MIT License',
     ],
     entry_points={
-        'console_scripts': ['lcom=src.command:cmd'],
+        'console_scripts': ['lcom=src.command:main'],
     }
 )
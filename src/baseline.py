@@ -0,0 +1,80 @@
+import json
+import os
+import tempfile
+
+from src.watch import WatchedFile
+
+
+class BaselineError(Exception):
+    pass
+
+
+class Baseline(object):
+    VERSION = 1
+
+    @classmethod
+    def load(cls, path, algorithm):
+        try:
+            with open(path, 'r') as handle:
+                entry = json.load(handle)
+        except (IOError, OSError):
+            return cls(algorithm)
+        except ValueError as e:
+            raise BaselineError('Invalid baseline %s: %s' % (path, e))
+
+        if not isinstance(entry, dict) or entry.get('version') != cls.VERSION:
+            raise BaselineError('Unsupported baseline %s' % path)
+
+        if entry.get('algorithm') != algorithm:
+            raise BaselineError('Baseline %s was recorded with %s' % (
+                path, entry.get('algorithm')
+            ))
+
+        try:
+            return cls(algorithm, [
+                (
+                    os.path.normpath(file),
+                    WatchedFile(None, elem['digest'], [
+                        (name, tuple(score) if isinstance(score, list)
+                         else score)
+                        for name, score in elem['scores']
+                    ])
+                )
+                for file, elem in sorted(entry['files'].items())
+            ])
+        except (KeyError, TypeError, ValueError, AttributeError):
+            raise BaselineError('Invalid baseline %s' % path)
+
+    def __init__(self, algorithm, files=()):
+        self.__algorithm = algorithm
+        self.__files = list(files)
+
+    def files(self):
+        return list(self.__files)
+
+    def save(self, path):
+        entry = {
+            'version': self.VERSION,
+            'algorithm': self.__algorithm,
+            'files': {
+                file.replace(os.path.sep, '/'): {
+                    'digest': elem.digest,
+                    'scores': [[name, score] for name, score in elem.scores],
+                }
+                for file, elem in self.__files
+            },
+        }
+
+        directory = os.path.dirname(os.path.abspath(path))
+        try:
+            handle, temp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        except (IOError, OSError) as e:
+            raise BaselineError('Unable to write baseline %s: %s' % (path, e))
+
+        try:
+            with os.fdopen(handle, 'w') as stream:
+                json.dump(entry, stream, indent=2, sort_keys=True)
+            os.rename(temp, path)
+        except (IOError, OSError) as e:
+            os.remove(temp)
+            raise BaselineError('Unable to write baseline %s: %s' % (path, e))
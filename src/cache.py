@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+import platform
+import tempfile
+
+
+class ResultCache(object):
+    VERSION = 1
+
+    def __init__(self, directory, algorithm):
+        self.__directory = directory
+        self.__algorithm = algorithm
+
+    def key(self, name, content):
+        digest = hashlib.sha1()
+        for part in (
+            str(self.VERSION),
+            platform.python_implementation(),
+            platform.python_version(),
+            self.__algorithm,
+            name,
+        ):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get(self, key):
+        try:
+            with open(self.__path(key), 'r') as handle:
+                entry = json.load(handle)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if not self.__is_valid(key, entry):
+            return None
+
+        return [
+            (name, tuple(score) if isinstance(score, list) else score)
+            for name, score in entry['scores']
+        ]
+
+    def set(self, key, scores):
+        path = self.__path(key)
+        directory = os.path.dirname(path)
+        entry = {
+            'key': key,
+            'scores': [[name, score] for name, score in scores],
+        }
+
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            handle, temp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        except (IOError, OSError):
+            return
+
+        try:
+            with os.fdopen(handle, 'w') as stream:
+                json.dump(entry, stream)
+            os.rename(temp, path)
+        except (IOError, OSError):
+            os.remove(temp)
+
+    def __path(self, key):
+        return os.path.join(self.__directory, key[:2], '%s.json' % key)
+
+    def __is_valid(self, key, entry):
+        try:
+            return entry['key'] == key and all(
+                len(elem) == 2 and self.__is_score(elem[1])
+                for elem in entry['scores']
+            )
+        except (KeyError, TypeError):
+            return False
+
+    def __is_score(self, score):
+        if isinstance(score, list):
+            return all(self.__is_score(elem) for elem in score)
+        return isinstance(score, (int, float)) \
+            and not isinstance(score, bool)
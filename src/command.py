@@ -1,70 +1,253 @@
 import os
+import sys
 from abc import ABCMeta, abstractmethod
 
 import click
-from terminaltables.ascii_table import AsciiTable
 
-from src.lcom import LCOM4
-from src.reflection import ModuleReflection
+try:
+    from os import scandir
+except ImportError:  # pragma: no cover
+    from scandir import scandir
 
 
 class FileSystem(object):
-    def __init__(self, extension='py', separator='.'):
-        self.__extension = extension
-        self.__separator = separator
+    EXCLUDE = (
+        '.git', '.hg', '.svn', '.tox', '.nox', '.eggs', '*.egg-info',
+        '__pycache__', '.mypy_cache', '.pytest_cache', 'node_modules',
+        '.venv', 'venv',
+    )
+    VIRTUALENV = 'pyvenv.cfg'
+
+    def __init__(self, extension='py', separator='.', exclude=EXCLUDE,
+                 include=(), gitignore=True):
+        from fnmatch import fnmatch
+
+        self.__fnmatch = fnmatch
+        self.__suffix = separator + extension
+        self.__exclude = tuple(exclude)
+        self.__include = tuple(include)
+        self.__gitignore = gitignore
 
     def find(self, path, filename=None):
-        if os.path.isfile(path):
-            return self.__find_in_file(path, filename)
-        return self.__find_in_directory(path, filename)
+        from src.reflection import ModuleReflection
 
-    def __find_in_directory(self, path, filename=None):
-        result = []
-        for root, dirs, files in os.walk(path):
-            for file in files:
-                result += self.__find_in_file(
-                    os.path.join(root, file),
-                    filename
-                )
-        return result
+        for file in self.files(path, filename):
+            yield ModuleReflection.from_file(file)
+
+    def files(self, path, filename=None):
+        from src.ignore import GitIgnore
+
+        is_file = os.path.isfile(path)
+        root = self.__root(path, is_file)
+        ignore = GitIgnore.for_directory(root) if self.__gitignore else None
+
+        relative = os.path.relpath(path, root)
+        parts = relative.split(os.path.sep) if relative != os.curdir else []
+        directory = root
+        for index, part in enumerate(parts):
+            if ignore is not None:
+                ignore = ignore.descend(directory)
+            directory = os.path.join(directory, part)
+            is_directory = not is_file or index < len(parts) - 1
+            if self.__is_ignored(root, directory, ignore, is_directory):
+                return []
+
+        if is_file:
+            return self.__find_in_file(root, path, filename)
+        return self.__find_in_directory(root, path, ignore, filename)
+
+    def __root(self, path, is_file):
+        relative = os.path.relpath(path, os.curdir)
+        if relative != os.pardir \
+                and not relative.startswith(os.pardir + os.path.sep):
+            return os.curdir
+        if is_file:
+            return os.path.dirname(os.path.abspath(path))
+        return path
+
+    def __find_in_directory(self, root, path, ignore, filename=None):
+        directories = [(path, ignore)]
+        while directories:
+            directory, ignore = directories.pop()
+            if ignore is not None:
+                ignore = ignore.descend(directory)
 
-    def __find_in_file(self, path, filename=None):
-        if self.__has_extension(path) and self.__matches(path, filename):
-            return [ModuleReflection.from_file(path)]
+            try:
+                entries = sorted(scandir(directory), key=lambda x: x.name)
+            except OSError:
+                continue
+
+            found = list()
+            for entry in entries:
+                file = os.path.join(directory, entry.name)
+                if self.__is_ignored(root, file, ignore, entry.is_dir()):
+                    continue
+
+                if entry.is_dir(follow_symlinks=False):
+                    if not self.__is_virtualenv(file):
+                        found.append((file, ignore))
+                elif entry.is_file():
+                    for elem in self.__find_in_file(root, file, filename):
+                        yield elem
+
+            directories += reversed(found)
+
+    def __find_in_file(self, root, path, filename=None):
+        if all([
+            self.__has_extension(path),
+            self.__matches(path, filename),
+            self.__is_included(root, path),
+            not self.__is_excluded(root, path),
+        ]):
+            return [path]
         return []
 
     def __has_extension(self, file):
-        return file.split(self.__separator)[-1] == self.__extension
+        return file.endswith(self.__suffix)
 
     def __matches(self, file, filename):
         return filename is None or filename in file
 
+    def __is_ignored(self, root, path, ignore, is_directory):
+        if self.__is_excluded(root, path):
+            return True
+        return ignore is not None and ignore.ignores(path, is_directory)
+
+    def __is_excluded(self, root, path):
+        return self.__matches_any(root, path, self.__exclude)
+
+    def __is_included(self, root, path):
+        if not self.__include:
+            return True
+        return self.__matches_any(root, path, self.__include)
+
+    def __matches_any(self, root, path, patterns):
+        name = os.path.basename(path)
+        relative = os.path.relpath(path, root).replace(os.path.sep, '/')
+        return any(
+            self.__fnmatch(name, pattern) or self.__fnmatch(relative, pattern)
+            for pattern in patterns
+        )
+
+    def __is_virtualenv(self, directory):
+        return os.path.isfile(os.path.join(directory, self.VIRTUALENV))
+
 
 class LCOMFactory(object):
+    LCOM1 = 'LCOM1'
+    LCOM2 = 'LCOM2'
+    LCOM3 = 'LCOM3'
     LCOM4 = 'LCOM4'
+    LCOM5 = 'LCOM5'
+    TCC = 'TCC'
+    LCC = 'LCC'
+    FRACTIONS = (LCOM5, TCC, LCC)
+    SEPARATOR = ','
+
+    PYTHON = 'python'
+    BITSET = 'bitset'
+    NUMPY = 'numpy'
+    BACKENDS = (PYTHON, BITSET, NUMPY)
 
     @classmethod
-    def create(cls, alg):
+    def create(cls, alg, backend=PYTHON):
+        from src import lcom
+
+        if cls.SEPARATOR in alg:
+            return lcom.LCOMSuite(
+                cls.create(elem.strip(), backend)
+                for elem in alg.split(cls.SEPARATOR)
+            )
+
         if alg == cls.LCOM4:
-            return LCOM4()
+            return cls.__lcom4(backend)
+
+        algorithms = {
+            cls.LCOM1: lcom.LCOM1,
+            cls.LCOM2: lcom.LCOM2,
+            cls.LCOM3: lcom.LCOM3,
+            cls.LCOM5: lcom.LCOM5,
+            cls.TCC: lcom.TCC,
+            cls.LCC: lcom.LCC,
+        }
+        if alg in algorithms:
+            return algorithms[alg]()
         raise Exception('Unknown algorithm %s' % alg)
 
+    @classmethod
+    def __lcom4(cls, backend):
+        from src.lcom import LCOM4, BitsetLCOM4, NumpyLCOM4
+
+        if backend == cls.PYTHON:
+            return LCOM4()
+        if backend == cls.BITSET:
+            return BitsetLCOM4()
+        if backend == cls.NUMPY:
+            return NumpyLCOM4()
+        raise Exception('Unknown backend %s' % backend)
+
 
 class Printer(object):
     __metaclass__ = ABCMeta
 
-    @abstractmethod
     def render(self, algorithm, classes, average):
+        self.start(algorithm)
+        for name, score in classes:
+            self.row(name, score)
+        self.finish(average)
+
+    def metrics(self, algorithm, score):
+        if isinstance(score, (tuple, list)):
+            return list(zip(algorithm.split(LCOMFactory.SEPARATOR), score))
+        return [(algorithm, score)]
+
+    @abstractmethod
+    def start(self, algorithm):
         raise NotImplementedError()
 
+    @abstractmethod
+    def row(self, name, score):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def finish(self, average):
+        raise NotImplementedError()
+
+    def rollup(self, rollup):
+        pass
+
 
 class STDOut(Printer):
-    def render(self, algorithm, classes, average):
+    def __init__(self):
+        self.__classes = list()
+        self.__header = ('Method', 'LCOM')
+
+    def start(self, algorithm):
+        self.__classes = list()
+        self.__header = ('Method', 'LCOM')
+        if LCOMFactory.SEPARATOR in algorithm:
+            self.__header = ('Method',) + tuple(
+                algorithm.split(LCOMFactory.SEPARATOR)
+            )
         print('%sCalculating LCOM using %s' % (os.linesep, algorithm))
 
-        header = [('Method', 'LCOM')]
-        classes = sorted(classes, key=lambda x: x[0])
-        summary = [('Average', "%.2f" % average)]
+    def row(self, name, score):
+        if not isinstance(score, (tuple, list)):
+            score = (score,)
+        self.__classes.append((name,) + tuple(
+            "%.2f" % elem if isinstance(elem, float) else elem
+            for elem in score
+        ))
+
+    def finish(self, average):
+        from terminaltables.ascii_table import AsciiTable
+
+        header = [self.__header]
+        classes = sorted(self.__classes, key=lambda x: x[0])
+        if isinstance(average, (tuple, list)):
+            summary = [('Average',) + tuple("%.2f" % elem for elem in average)]
+        else:
+            summary = [('Average', "%.2f" % average)]
 
         table = AsciiTable(header + classes + summary)
         table.inner_heading_row_border = True
@@ -72,60 +255,797 @@ class STDOut(Printer):
 
         print(table.table)
 
+    def rollup(self, rollup):
+        from terminaltables.ascii_table import AsciiTable
+
+        header = [
+            ('Package', 'Classes', 'Average', 'Max') + tuple(
+                'P%g' % (q * 100) for q in rollup.PERCENTILES
+            ) + tuple(rollup.labels())
+        ]
+        rows = [
+            (name, node.count(), '%.2f' % node.average()) + tuple(
+                '%.2f' % elem if isinstance(elem, float) else elem
+                for elem in [node.maximum()] + [
+                    node.percentile(q) for q in rollup.PERCENTILES
+                ]
+            ) + tuple(node.histogram().counts())
+            for name, node in rollup.nodes()
+        ]
+
+        table = AsciiTable(header + rows)
+        table.inner_heading_row_border = True
+
+        print(table.table)
+
+
+class StreamPrinter(Printer):
+    def __init__(self, stream=None):
+        self.__stream = stream
+        self.__count = 0
+
+    def start(self, algorithm):
+        self.__count = 0
+
+    def row(self, name, score):
+        self.__count += 1
+
+    def count(self):
+        return self.__count
+
+    def stream(self):
+        return self.__stream or sys.stdout
+
+    def write(self, line):
+        stream = self.stream()
+        stream.write(line)
+        stream.flush()
+
+
+class JSONLines(StreamPrinter):
+    def start(self, algorithm):
+        import json
+
+        super(JSONLines, self).start(algorithm)
+        self.__algorithm = algorithm
+        self.__dumps = json.dumps
+
+    def row(self, name, score):
+        super(JSONLines, self).row(name, score)
+        for algorithm, value in self.metrics(self.__algorithm, score):
+            self.__write({
+                'type': 'class',
+                'algorithm': algorithm,
+                'name': name,
+                'score': value,
+            })
+
+    def finish(self, average):
+        for algorithm, value in self.metrics(self.__algorithm, average):
+            self.__write({
+                'type': 'summary',
+                'algorithm': algorithm,
+                'classes': self.count(),
+                'average': value,
+            })
+
+    def rollup(self, rollup):
+        algorithm = self.__algorithm.split(LCOMFactory.SEPARATOR)[0]
+        labels = rollup.labels()
+        for name, node in rollup.nodes():
+            record = {
+                'type': 'rollup',
+                'algorithm': algorithm,
+                'name': name,
+                'classes': node.count(),
+                'average': node.average(),
+                'max': node.maximum(),
+                'histogram': dict(zip(labels, node.histogram().counts())),
+            }
+            for q in rollup.PERCENTILES:
+                record['p%g' % (q * 100)] = node.percentile(q)
+            self.__write(record)
+
+    def __write(self, record):
+        self.write(self.__dumps(record, sort_keys=True) + '\n')
+
+
+class CSV(StreamPrinter):
+    SUMMARY = 'Average'
+
+    def start(self, algorithm):
+        import csv
+
+        super(CSV, self).start(algorithm)
+        self.__algorithm = algorithm
+        self.__writer = csv.writer(self.stream(), lineterminator='\n')
+        self.__write(('name', 'algorithm', 'score'))
+
+    def row(self, name, score):
+        super(CSV, self).row(name, score)
+        for algorithm, value in self.metrics(self.__algorithm, score):
+            self.__write((name, algorithm, value))
+
+    def finish(self, average):
+        for algorithm, value in self.metrics(self.__algorithm, average):
+            self.__write((self.SUMMARY, algorithm, value))
+
+    def __write(self, row):
+        self.__writer.writerow(row)
+        self.stream().flush()
+
 
 class PrinterFactory(object):
     STD = 'STDOut'
+    JSONL = 'jsonl'
+    CSV = 'csv'
 
     @classmethod
     def create(cls, printer):
         if printer == cls.STD:
             return STDOut()
+        if printer == cls.JSONL:
+            return JSONLines()
+        if printer == cls.CSV:
+            return CSV()
         raise Exception('Unknown printer %s' % printer)
 
 
+class Average(object):
+    def __init__(self):
+        self.__total = 0
+        self.__count = 0
+
+    def add(self, value):
+        if isinstance(value, (tuple, list)):
+            self.__total = tuple(
+                total + elem
+                for total, elem in zip(
+                    self.__total or (0,) * len(value),
+                    value
+                )
+            )
+        else:
+            self.__total += value
+        self.__count += 1
+
+    def value(self):
+        if not self.__count:
+            return 0
+        if isinstance(self.__total, tuple):
+            return tuple(float(elem) / self.__count for elem in self.__total)
+        return float(self.__total) / self.__count
+
+
+class Gate(object):
+    def __init__(self, max_score=None, max_average=None, fail_fast=False):
+        self.__max_score = max_score
+        self.__max_average = max_average
+        self.__fail_fast = fail_fast
+        self.__violations = list()
+
+    def add(self, name, score):
+        score = self.__primary(score)
+        if self.__max_score is not None and score > self.__max_score:
+            self.__violations.append(
+                '%s: %s exceeds %g' % (name, score, self.__max_score)
+            )
+
+    def finish(self, average):
+        average = self.__primary(average)
+        if self.__max_average is not None and average > self.__max_average:
+            self.__violations.append(
+                'Average: %.2f exceeds %g' % (average, self.__max_average)
+            )
+
+    def stopped(self):
+        return self.__fail_fast and bool(self.__violations)
+
+    def violations(self):
+        return list(self.__violations)
+
+    def __primary(self, score):
+        if isinstance(score, (tuple, list)):
+            return score[0]
+        return score
+
+
+class ModuleScorer(object):
+    def __init__(self, lcom, cache=None, profiler=None, isolate=False,
+                 timeout=None):
+        from src.profiler import NullProfiler
+
+        self.__lcom = lcom
+        self.__cache = cache
+        self.__profiler = profiler or NullProfiler()
+        self.__isolate = isolate
+        self.__timeout = timeout
+
+    def __call__(self, file):
+        try:
+            content = self.__read(file)
+        except (IOError, OSError) as e:
+            return self.failed(file, e)
+        return self.content(file, content)
+
+    def failed(self, file, error):
+        from src.isolation import ModuleScores
+
+        if not self.__isolate:
+            raise error
+        return ModuleScores(skipped=[(file, self.__reason(error))])
+
+    def content(self, file, content):
+        from src.reflection import ModuleReflection
+
+        return self.source(ModuleReflection.module_name(file), content, file)
+
+    def source(self, name, content, file=None):
+        if self.__cache is None:
+            return self.__guarded(file or name, name, content)
+
+        if not isinstance(content, bytes):
+            content = content.encode('utf-8')
+
+        from src.isolation import ModuleScores
+
+        key = self.__cache.key(name, content)
+        result = self.__cache.get(key)
+        if result is not None:
+            return ModuleScores(result, module=name)
+
+        result = self.__guarded(file or name, name, content)
+        if not result.skipped:
+            self.__cache.set(key, result)
+        return result
+
+    def cached(self, file):
+        if self.__cache is None:
+            return None
+
+        from src.isolation import ModuleScores
+        from src.reflection import ModuleReflection
+
+        name = ModuleReflection.module_name(file)
+        try:
+            content = self.__read(file)
+        except (IOError, OSError):
+            if not self.__isolate:
+                raise
+            return None
+
+        result = self.__cache.get(self.__cache.key(name, content))
+        if result is None:
+            return None
+        return ModuleScores(result, module=name)
+
+    def score(self, mod, file=None):
+        from src.isolation import ModuleScores, ScoreTimeout
+
+        profiling = self.__profiler.enabled()
+        result = ModuleScores(module=mod.name())
+        for ref in mod.classes():
+            name = ref.name()
+            try:
+                if profiling:
+                    with self.__profiler.stage('extract', file, name):
+                        ref.methods()
+                with self.__profiler.stage('score', file, name):
+                    result.append((name, self.__lcom.calculate(ref)))
+            except ScoreTimeout:
+                raise
+            except Exception as e:
+                if not self.__isolate:
+                    raise
+                result.skipped.append((name, self.__reason(e)))
+        return result
+
+    def __guarded(self, file, name, content):
+        from src.isolation import TimeBudget
+
+        try:
+            with TimeBudget(self.__timeout):
+                return self.__score(file, name, content)
+        except Exception as e:
+            if not self.__isolate:
+                raise
+            return self.failed(file, e)
+
+    def __score(self, file, name, content):
+        import ast
+        from src.reflection import ModuleReflection
+
+        with self.__profiler.stage('parse', file):
+            node = ast.parse(content)
+        self.__profiler.nodes(file, node)
+        with self.__profiler.stage('extract', file):
+            mod = ModuleReflection(name, node)
+        del node
+        return self.score(mod, file)
+
+    def __read(self, file):
+        from src.reflection import ModuleReflection
+
+        with self.__profiler.stage('read', file):
+            with open(ModuleReflection.normalize_path(file), 'rb') as handle:
+                return handle.read()
+
+    def __reason(self, error):
+        return '%s: %s' % (error.__class__.__name__, error)
+
+
+class SourceScorer(object):
+    def __init__(self, scorer):
+        self.__scorer = scorer
+
+    def __call__(self, source):
+        name, content = source
+        return self.__scorer.source(name, content)
+
+
 class Runner(object):
-    def __init__(self, fs, lcom, printer):
+    CHUNK_SIZE = 8
+
+    def __init__(self, fs, lcom, printer, jobs=1, cache=None, profiler=None,
+                 reader=None, isolate=False, timeout=None):
+        from src.profiler import NullProfiler
+
+        if not jobs:
+            import multiprocessing
+            jobs = multiprocessing.cpu_count()
+
         self.__fs = fs
         self.__lcom = lcom
         self.__printer = printer
+        self.__jobs = jobs
+        self.__profiler = profiler or NullProfiler()
+        self.__reader = reader
+        self.__scorer = ModuleScorer(
+            lcom, cache, self.__profiler, isolate, timeout
+        )
+        self.__skipped = list()
+        self.__by_file = any([
+            cache is not None,
+            reader is not None,
+            self.__profiler.enabled(),
+            isolate,
+            timeout
+        ])
 
-    def handle(self, paths, filter=None):
-        refs = list()
-        for path in paths:
-            refs += self.__gather_refs(path, filter)
+    def handle(self, paths, filter=None, context=(), gate=None, rollup=None):
+        if self.__jobs > 1 and not self.__profiler.enabled():
+            scores = self.__score_parallel(
+                self.__scorer,
+                self.__files(paths, filter)
+            )
+        else:
+            scores = self.__score_serial(paths, filter)
+
+        self.__render(
+            scores,
+            self.__score_context(paths, filter, context),
+            gate or Gate(),
+            rollup
+        )
 
-        cls, avg = self.__aggregate(refs)
-        self.__printer.render(self.__lcom.name(), cls, avg)
+    def handle_sources(self, sources, gate=None, rollup=None):
+        if self.__jobs > 1 and not self.__profiler.enabled():
+            scores = self.__score_parallel(
+                SourceScorer(self.__scorer),
+                sources
+            )
+        else:
+            scores = (
+                self.__scorer.source(name, content)
+                for name, content in sources
+            )
 
-    def __aggregate(self, refs):
-        result = list()
+        self.__render(scores, (), gate or Gate(), rollup)
 
-        if not refs:
-            return result, 0
+    def watch(self, paths, interval=1.0, filter=None):
+        import time
+        from src.watch import Watcher
 
-        for ref in refs:
-            result.append((
-                ref.name(),
-                self.__lcom.calculate(ref)
-            ))
+        watcher = Watcher(self.__fs, self.__scorer)
+        changes, errors = watcher.poll(paths, filter)
+        while True:
+            self.__render([watcher.scores()], (), Gate())
+            yield changes, errors
 
-        average = sum([elem[1] for elem in result]) / len(result)
-        return result, average
+            changes, errors = [], []
+            while not changes and not errors:
+                time.sleep(interval)
+                changes, errors = watcher.poll(paths, filter)
 
-    def __gather_refs(self, path, filter):
-        refs = list()
-        for mod in self.__fs.find(path, filter):
-            refs += mod.classes()
-        return refs
+    def diff(self, paths, files=(), filter=None, gate=None):
+        from src.watch import Watcher
 
+        watcher = Watcher(self.__fs, self.__scorer, files)
+        changes, errors = watcher.poll(paths, filter)
+
+        changed = set(elem.name for elem in changes if elem.after is not None)
+        scores = watcher.scores()
+        self.__render(
+            [[elem for elem in scores if elem[0] in changed]],
+            [[elem for elem in scores if elem[0] not in changed]],
+            gate or Gate()
+        )
+        self.__skipped = list(errors)
+        return watcher.files(), changes, errors
+
+    def skipped(self):
+        return list(self.__skipped)
+
+    def __render(self, scores, context, gate, rollup=None):
+        average = Average()
+        self.__skipped = list()
+        self.__printer.start(self.__lcom.name())
+        for elem in scores:
+            self.__skipped += getattr(elem, 'skipped', [])
+            module = getattr(elem, 'module', None)
+            for name, score in elem:
+                average.add(score)
+                gate.add(name, score)
+                if rollup is not None:
+                    rollup.add(module or name.rsplit('.', 1)[0], score)
+                self.__printer.row(name, score)
+
+            if gate.stopped():
+                getattr(scores, 'close', lambda: None)()
+                break
+        else:
+            for elem in context:
+                module = getattr(elem, 'module', None)
+                for name, score in elem:
+                    average.add(score)
+                    if rollup is not None:
+                        rollup.add(module or name.rsplit('.', 1)[0], score)
+
+        self.__printer.finish(average.value())
+        if rollup is not None:
+            self.__printer.rollup(rollup)
+        if not gate.stopped():
+            gate.finish(average.value())
+
+    def __score_context(self, paths, filter, context):
+        if not context:
+            return
+
+        scored = {
+            os.path.normpath(file)
+            for file in self.__files(paths, filter)
+        }
+        for file in self.__files(context, filter):
+            if os.path.normpath(file) in scored:
+                continue
+
+            scores = self.__scorer.cached(file)
+            if scores is not None:
+                yield scores
+
+    def __score_serial(self, paths, filter):
+        if self.__reader is not None:
+            contents = self.__profiler.iterate(
+                'read',
+                self.__reader.read(self.__files(paths, filter))
+            )
+            for file, content in contents:
+                if isinstance(content, Exception):
+                    yield self.__scorer.failed(file, content)
+                else:
+                    yield self.__scorer.content(file, content)
+            return
+
+        if self.__by_file:
+            files = self.__profiler.iterate(
+                'discover',
+                self.__files(paths, filter)
+            )
+            for file in files:
+                yield self.__scorer(file)
+            return
 
-@click.command()
+        for path in paths:
+            for mod in self.__fs.find(path, filter):
+                yield self.__scorer.score(mod)
+
+    def __score_parallel(self, scorer, items):
+        import multiprocessing
+
+        pool = multiprocessing.Pool(self.__jobs)
+        try:
+            for scores in pool.imap(scorer, items, self.CHUNK_SIZE):
+                yield scores
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def __files(self, paths, filter):
+        for path in paths:
+            for file in self.__fs.files(path, filter):
+                yield file
+
+
+@click.command(help='Score classes found in given paths.')
 @click.argument('paths', nargs=-1)
-@click.option('--algorithm', default=LCOMFactory.LCOM4)
+@click.option('--algorithm', default=LCOMFactory.LCOM4,
+              help='Algorithm or comma separated list of algorithms: '
+                   'LCOM1, LCOM2, LCOM3, LCOM4, LCOM5, TCC, LCC.')
+@click.option('--backend', default=LCOMFactory.PYTHON,
+              type=click.Choice(LCOMFactory.BACKENDS),
+              help='Cohesion graph backend, numpy falls back to bitset.')
 @click.option('--printer', default=PrinterFactory.STD)
-def cmd(paths, algorithm, printer):
-    Runner(
-        FileSystem(),
-        LCOMFactory.create(algorithm),
-        PrinterFactory.create(printer)
-    ).handle(paths)
+@click.option('--jobs', '-j', default=1, type=click.IntRange(min=0),
+              help='Number of worker processes, 0 for one per CPU.')
+@click.option('--io-threads', default=0, type=click.IntRange(min=0),
+              help='Number of threads prefetching files, 0 to read them '
+                   'one at a time.')
+@click.option('--cache-dir', default=None,
+              help='Directory for per-file results keyed by content hash.')
+@click.option('--since', default=None, metavar='REV',
+              help='Score only files changed since the given git revision.')
+@click.option('--changed-only', is_flag=True,
+              help='Score only files changed in the git working tree.')
+@click.option('--repo-average', is_flag=True,
+              help='Include cached scores of unchanged files in the average, '
+                   'requires --cache-dir.')
+@click.option('--exclude', multiple=True, metavar='GLOB',
+              help='Skip files and directories matching the pattern.')
+@click.option('--include', multiple=True, metavar='GLOB',
+              help='Score only files matching the pattern.')
+@click.option('--no-gitignore', is_flag=True,
+              help='Do not skip files listed in .gitignore.')
+@click.option('--stdin', 'from_stdin', is_flag=True,
+              help='Score sources read from stdin as JSON Lines with '
+                   '"name" (or "file") and "source" keys instead of paths.')
+@click.option('--timeout', default=None, type=float, metavar='SECONDS',
+              help='Skip files taking longer to parse and score.')
+@click.option('--strict', is_flag=True,
+              help='Stop at the first file or class that cannot be scored, '
+                   'instead of skipping it.')
+@click.option('--allow-skipped', is_flag=True,
+              help='Exit with success even if files or classes were skipped.')
+@click.option('--baseline', default=None, metavar='FILE',
+              help='Report only classes whose score changed since the '
+                   'baseline, re-scoring only modified files.')
+@click.option('--update-baseline', is_flag=True,
+              help='Write current scores back to the --baseline file.')
+@click.option('--max-lcom', default=None, type=float, metavar='N',
+              help='Fail when any class scores above N.')
+@click.option('--max-average', default=None, type=float, metavar='X',
+              help='Fail when the average score is above X.')
+@click.option('--fail-fast', is_flag=True,
+              help='Stop scoring at the first class above --max-lcom.')
+@click.option('--watch', is_flag=True,
+              help='Keep running and re-score files as they change.')
+@click.option('--watch-interval', default=0.25, type=float,
+              help='Seconds between checks for modified files.')
+@click.option('--rollup', is_flag=True,
+              help='Report count, average, maximum, percentiles and '
+                   'a histogram of scores per package and module.')
+@click.option('--rollup-depth', default=None, type=click.IntRange(min=1),
+              metavar='N', help='Roll up only the first N name levels.')
+@click.option('--profile', is_flag=True,
+              help='Report time spent per stage, file and class on stderr. '
+                   'Implies --jobs 1.')
+@click.option('--profile-top', default=10, type=click.IntRange(min=1),
+              help='Number of slowest files and classes to report.')
+@click.option('--profile-output', default=None, metavar='FILE',
+              help='Dump cProfile statistics to the file.')
+def cmd(paths, algorithm, backend, printer, jobs, io_threads, cache_dir, since,
+        changed_only, repo_average, exclude, include, no_gitignore,
+        from_stdin, timeout, strict, allow_skipped, baseline, update_baseline,
+        max_lcom, max_average, fail_fast, watch, watch_interval, rollup,
+        rollup_depth, profile, profile_top, profile_output):
+    if repo_average and not cache_dir:
+        raise click.UsageError('--repo-average requires --cache-dir')
+    if rollup and (watch or baseline):
+        raise click.UsageError(
+            '--rollup cannot be combined with --watch or --baseline'
+        )
+
+    context = ()
+    if since or changed_only:
+        from src.vcs import Git, GitError
+
+        try:
+            changed = Git().changed_files(since or 'HEAD', paths)
+        except GitError as e:
+            raise click.ClickException(str(e))
+
+        if repo_average:
+            context = paths or (os.curdir,)
+        paths = changed
+
+    profiler = None
+    if profile:
+        from src.profiler import Profiler
+
+        profiler = Profiler(profile_top)
+
+    cache = None
+    if cache_dir:
+        from src.cache import ResultCache
+
+        cache = ResultCache(cache_dir, algorithm)
+
+    reader = None
+    if io_threads:
+        from src.reader import BulkReader
+
+        reader = BulkReader(io_threads, tolerant=not strict)
+
+    runner = Runner(
+        FileSystem(
+            exclude=FileSystem.EXCLUDE + exclude,
+            include=include,
+            gitignore=not no_gitignore
+        ),
+        LCOMFactory.create(algorithm, backend),
+        PrinterFactory.create(printer),
+        jobs,
+        cache,
+        profiler,
+        reader,
+        not strict,
+        timeout
+    )
+
+    if watch:
+        try:
+            watching = runner.watch(paths, watch_interval)
+            for index, (changes, errors) in enumerate(watching):
+                for file, message in errors:
+                    click.echo('%s: %s' % (file, message), err=True)
+                for change in changes if index else ():
+                    click.echo('%s: %s -> %s' % change, err=True)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    gate = Gate(max_lcom, max_average, fail_fast)
+    if rollup:
+        from src.rollup import Rollup
+
+        primary = algorithm.split(LCOMFactory.SEPARATOR)[0].strip()
+        rollup = Rollup(
+            Rollup.FRACTIONS if primary in LCOMFactory.FRACTIONS
+            else Rollup.INTEGERS,
+            rollup_depth
+        )
+    else:
+        rollup = None
+
+    if from_stdin:
+        from src.reader import JSONLinesReader, SourceError
+
+        try:
+            runner.handle_sources(
+                JSONLinesReader().read(click.get_text_stream('stdin')),
+                gate=gate,
+                rollup=rollup
+            )
+        except SourceError as e:
+            raise click.ClickException(str(e))
+    elif baseline:
+        from src.baseline import Baseline, BaselineError
+
+        try:
+            files = Baseline.load(baseline, algorithm).files()
+            files, changes, errors = runner.diff(paths, files, gate=gate)
+            for change in changes:
+                click.echo('%s: %s -> %s' % change, err=True)
+            if update_baseline:
+                Baseline(algorithm, files).save(baseline)
+        except BaselineError as e:
+            raise click.ClickException(str(e))
+    elif profile_output:
+        import cProfile
+
+        stats = cProfile.Profile()
+        stats.runcall(runner.handle, paths, context=context, gate=gate,
+                      rollup=rollup)
+        stats.dump_stats(profile_output)
+    else:
+        runner.handle(paths, context=context, gate=gate, rollup=rollup)
+
+    if profiler is not None:
+        profiler.report()
+
+    if runner.skipped():
+        click.echo('Skipped %d files or classes:' % len(runner.skipped()),
+                   err=True)
+        for name, reason in runner.skipped():
+            click.echo('  %s: %s' % (name, reason), err=True)
+
+    for violation in gate.violations():
+        click.echo(violation, err=True)
+    if gate.violations() or (runner.skipped() and not allow_skipped):
+        sys.exit(1)
+
+
+class DefaultGroup(click.Group):
+    def __init__(self, *args, **kwargs):
+        self.default = kwargs.pop('default')
+        super(DefaultGroup, self).__init__(*args, **kwargs)
+
+    def parse_args(self, ctx, args):
+        if not args or args[0] not in self.commands and args[0] != '--help':
+            args = [self.default] + list(args)
+        return super(DefaultGroup, self).parse_args(ctx, args)
+
+
+@click.command(help='Keep scores in memory and answer queries on a socket.')
+@click.option('--socket', 'path', default='.lcom.sock',
+              help='Unix socket to listen on.')
+@click.option('--algorithm', default=LCOMFactory.LCOM4,
+              help='Algorithm or comma separated list of algorithms.')
+@click.option('--backend', default=LCOMFactory.PYTHON,
+              type=click.Choice(LCOMFactory.BACKENDS))
+@click.option('--cache-size', default=1024, type=click.IntRange(min=1),
+              help='Number of files kept in memory.')
+def serve(path, algorithm, backend, cache_size):
+    from src.server import LRUCache, ScoreServer, ScoreService, ServerError
+
+    lcom = LCOMFactory.create(algorithm, backend)
+    try:
+        server = ScoreServer(path, ScoreService(
+            lcom,
+            ModuleScorer(lcom),
+            LRUCache(cache_size)
+        ))
+    except ServerError as e:
+        raise click.ClickException(str(e))
+    click.echo('Listening on %s' % path, err=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+@click.command(help='Score files through a running lcom serve.')
+@click.argument('files', nargs=-1)
+@click.option('--socket', 'path', default='.lcom.sock',
+              help='Unix socket of a running lcom serve.')
+@click.option('--class', 'name', default=None,
+              help='Qualified name of a single class to score.')
+@click.option('--printer', default=PrinterFactory.STD)
+def query(files, path, name, printer):
+    from src.server import Client, ServerError
+
+    client = Client(path)
+    algorithm = None
+    average = Average()
+    classes = list()
+    try:
+        for file in files:
+            algorithm, scores = client.query(
+                file, name if len(files) == 1 else None
+            )
+            for elem in scores:
+                if name is None or elem[0] == name:
+                    average.add(elem[1])
+                    classes.append(elem)
+    except ServerError as e:
+        raise click.ClickException(str(e))
+
+    if name is not None and files and not classes:
+        raise click.ClickException('Unknown class %s' % name)
+
+    if algorithm is not None:
+        PrinterFactory.create(printer).render(
+            algorithm, classes, average.value()
+        )
+
+
+@click.group(cls=DefaultGroup, default='score')
+def main():
+    pass
+
+
+main.add_command(cmd, 'score')
+main.add_command(serve)
+main.add_command(query)
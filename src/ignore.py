@@ -0,0 +1,91 @@
+import os
+from collections import namedtuple
+from fnmatch import fnmatch
+
+IgnoreRule = namedtuple(
+    'IgnoreRule',
+    ['base', 'pattern', 'negate', 'directory_only', 'anchored']
+)
+
+
+class GitIgnore(object):
+    FILE = '.gitignore'
+    REPOSITORY = '.git'
+
+    @classmethod
+    def for_directory(cls, path):
+        current = os.path.abspath(path)
+        ancestors = list()
+        while not os.path.exists(os.path.join(current, cls.REPOSITORY)):
+            parent = os.path.dirname(current)
+            if parent == current:
+                return cls()
+            ancestors.append(parent)
+            current = parent
+
+        result = cls()
+        for ancestor in reversed(ancestors):
+            result = result.descend(ancestor)
+        return result
+
+    @classmethod
+    def parse(cls, base, lines):
+        result = list()
+        for line in lines:
+            line = line.rstrip('\r\n')
+            if not line.strip() or line.startswith('#'):
+                continue
+
+            line = line.rstrip(' ')
+            negate = line.startswith('!')
+            if negate or line.startswith('\\'):
+                line = line[1:]
+
+            directory_only = line.endswith('/')
+            line = line.rstrip('/')
+            anchored = '/' in line
+            line = line.lstrip('/')
+            if line.startswith('**/'):
+                line = line[3:]
+                anchored = '/' in line
+
+            if line:
+                result.append(IgnoreRule(
+                    base, line, negate, directory_only, anchored
+                ))
+        return result
+
+    def __init__(self, rules=()):
+        self.__rules = tuple(rules)
+
+    def descend(self, directory):
+        directory = os.path.abspath(directory)
+        try:
+            with open(os.path.join(directory, self.FILE), 'r') as handle:
+                rules = self.parse(directory, handle)
+        except (IOError, OSError):
+            return self
+
+        if not rules:
+            return self
+        return GitIgnore(self.__rules + tuple(rules))
+
+    def ignores(self, path, is_directory=False):
+        path = os.path.abspath(path)
+        name = os.path.basename(path)
+        result = False
+        for rule in self.__rules:
+            if rule.directory_only and not is_directory:
+                continue
+            if self.__matches(rule, path, name):
+                result = not rule.negate
+        return result
+
+    def __matches(self, rule, path, name):
+        if not rule.anchored:
+            return fnmatch(name, rule.pattern)
+
+        relative = os.path.relpath(path, rule.base)
+        if relative.startswith(os.pardir):
+            return False
+        return fnmatch(relative.replace(os.path.sep, '/'), rule.pattern)
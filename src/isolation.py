@@ -0,0 +1,41 @@
+import signal
+
+
+class ScoreTimeout(Exception):
+    pass
+
+
+class ModuleScores(list):
+    def __init__(self, scores=(), skipped=(), module=None):
+        super(ModuleScores, self).__init__(scores)
+        self.skipped = list(skipped)
+        self.module = module
+
+
+class TimeBudget(object):
+    def __init__(self, seconds=None):
+        self.__seconds = seconds
+        self.__previous = None
+        self.__active = False
+
+    def __enter__(self):
+        if not self.__seconds or not hasattr(signal, 'setitimer'):
+            return self
+
+        try:
+            self.__previous = signal.signal(signal.SIGALRM, self.__expire)
+        except ValueError:  # signals are handled only in the main thread
+            return self
+        self.__active = True
+        signal.setitimer(signal.ITIMER_REAL, self.__seconds)
+        return self
+
+    def __exit__(self, *args):
+        if self.__active:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self.__previous or signal.SIG_DFL)
+            self.__active = False
+        return False
+
+    def __expire(self, signum, frame):
+        raise ScoreTimeout('Timed out after %gs' % self.__seconds)
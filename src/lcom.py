@@ -1,7 +1,206 @@
 from abc import ABCMeta, abstractmethod
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 
-from src.reflection import ReflectionError
+
+class DisjointSet(object):
+    def __init__(self):
+        self.__parent = dict()
+        self.__rank = dict()
+        self.__count = 0
+
+    def __len__(self):
+        return self.__count
+
+    def __contains__(self, item):
+        return item in self.__parent
+
+    def add(self, item):
+        if item in self.__parent:
+            return
+        self.__parent[item] = item
+        self.__rank[item] = 0
+        self.__count += 1
+
+    def find(self, item):
+        self.add(item)
+        parent = self.__parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, left, right):
+        left = self.find(left)
+        right = self.find(right)
+        if left == right:
+            return left
+
+        if self.__rank[left] < self.__rank[right]:
+            left, right = right, left
+
+        self.__parent[right] = left
+        if self.__rank[left] == self.__rank[right]:
+            self.__rank[left] += 1
+        self.__count -= 1
+        return left
+
+    def union_all(self, items):
+        root = None
+        for item in items:
+            if root is None:
+                root = self.find(item)
+                continue
+            root = self.union(root, item)
+        return root
+
+    def groups(self):
+        result = defaultdict(set)
+        for item in self.__parent:
+            result[self.find(item)].add(item)
+        return list(result.values())
+
+
+class CallClosure(object):
+    def __init__(self, calls, direct, empty=frozenset):
+        self.__calls = calls
+        self.__direct = direct
+        self.__empty = empty
+        self.__reach = None
+
+    def reach(self, name):
+        if self.__reach is None:
+            self.__reach = self.__build()
+        return self.__reach.get(name, self.__empty())
+
+    def __build(self):
+        result = dict()
+        for component in self.__components():
+            members = set(component)
+            reach = self.__empty()
+            for member in component:
+                reach |= self.__direct[member]
+                for call in self.__calls[member]:
+                    if call in result and call not in members:
+                        reach |= result[call]
+
+            for member in component:
+                result[member] = reach
+        return result
+
+    def __components(self):
+        index = dict()
+        low = dict()
+        stack = list()
+        on_stack = set()
+
+        for root in self.__calls:
+            if root in index:
+                continue
+
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.__calls[root]))]
+
+            while work:
+                node, calls = work[-1]
+                for call in calls:
+                    if call not in self.__calls:
+                        continue
+                    if call not in index:
+                        index[call] = low[call] = len(index)
+                        stack.append(call)
+                        on_stack.add(call)
+                        work.append((call, iter(self.__calls[call])))
+                        break
+                    if call in on_stack:
+                        low[node] = min(low[node], index[call])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+
+                    if low[node] == index[node]:
+                        yield self.__pop_component(node, stack, on_stack)
+
+    def __pop_component(self, node, stack, on_stack):
+        result = list()
+        while True:
+            member = stack.pop()
+            on_stack.discard(member)
+            result.append(member)
+            if member == node:
+                return result
+
+
+MethodNode = namedtuple(
+    'MethodNode',
+    ['name', 'vars', 'calls', 'is_constructor', 'is_related']
+)
+
+
+class ClassGraph(object):
+    @classmethod
+    def from_reflection(cls, ref):
+        return cls(tuple(
+            MethodNode(
+                method.name(),
+                frozenset(method.vars()),
+                tuple(method.calls()),
+                method.is_constructor(),
+                not any([
+                    method.is_constructor(),
+                    method.is_loose(),
+                    method.has_decorator('classmethod')
+                ])
+            )
+            for method in ref.methods()
+        ))
+
+    def __init__(self, methods):
+        self.__methods = methods
+        self.__attributes = None
+
+    def methods(self):
+        return self.__methods
+
+    def related(self):
+        return [method for method in self.__methods if method.is_related]
+
+    def members(self):
+        return [
+            method
+            for method in self.__methods
+            if not method.is_constructor
+        ]
+
+    def edges(self):
+        methods = {method.name: method for method in self.__methods}
+        pending = [method.name for method in self.related()]
+        reached = set(pending)
+        while pending:
+            method = methods[pending.pop()]
+            yield method.name, method.name
+            for name in method.vars:
+                yield method.name, name
+            for call in method.calls:
+                yield method.name, call
+                if call in methods and call not in reached:
+                    reached.add(call)
+                    pending.append(call)
+
+    def usage(self, method):
+        if self.__attributes is None:
+            self.__attributes = CallClosure(
+                {elem.name: elem.calls for elem in self.__methods},
+                {elem.name: elem.vars for elem in self.__methods}
+            )
+
+        result = method.vars
+        for call in method.calls:
+            result |= self.__attributes.reach(call)
+        return result
 
 
 class LCOMAlgorithm(object):
@@ -11,71 +210,208 @@ class LCOMAlgorithm(object):
     def name(self):
         raise NotImplementedError()
 
-    @abstractmethod
     def calculate(self, ref):
+        return self.measure(ClassGraph.from_reflection(ref))
+
+    @abstractmethod
+    def measure(self, graph):
         raise NotImplementedError()
 
 
-class LCOM4(LCOMAlgorithm):
-    def name(self):
-        return 'LCOM4'
+class LCOMSuite(LCOMAlgorithm):
+    def __init__(self, algorithms):
+        self.__algorithms = tuple(algorithms)
 
-    def calculate(self, ref):
-        paths = self.__call_paths(ref)
+    def name(self):
+        return ','.join(alg.name() for alg in self.__algorithms)
 
-        groups = self.__match_groups(paths.values())
-        groups = self.__match_groups(groups)
+    def measure(self, graph):
+        return tuple(alg.measure(graph) for alg in self.__algorithms)
 
-        return len(groups)
 
-    def __call_paths(self, ref):
-        result = defaultdict(set)
-        for method in ref.methods():
-            if any([
-                method.is_constructor(),
-                method.is_loose(),
-                method.has_decorator('classmethod')
-            ]):
-                continue
+class PairwiseAlgorithm(LCOMAlgorithm):
+    def pairs(self, sets):
+        bits = defaultdict(lambda: 1 << len(bits))
+        masks = list()
+        for elem in sets:
+            mask = 0
+            for name in elem:
+                mask |= bits[name]
+            masks.append(mask)
 
-            name = method.name()
-            result[name] |= set([name] + method.vars())
-            for call in method.calls():
-                result[name].add(call)
-                result[call].add(name)
-                result[name] |= self.__follow_call(ref, call)
+        connected = [
+            (i, j)
+            for i in range(len(masks))
+            for j in range(i + 1, len(masks))
+            if masks[i] & masks[j]
+        ]
+        return len(masks) * (len(masks) - 1) // 2, connected
 
+    def components(self, size, connected):
+        result = DisjointSet()
+        for i in range(size):
+            result.add(i)
+        for i, j in connected:
+            result.union(i, j)
         return result
 
-    def __follow_call(self, ref, name):
-        try:
-            method = ref.method_by_name(name)
-        except ReflectionError:
-            return set()
 
-        result = set(method.vars() + method.calls())
+class LCOM1(PairwiseAlgorithm):
+    def name(self):
+        return 'LCOM1'
+
+    def measure(self, graph):
+        total, connected = self.pairs(
+            method.vars for method in graph.members()
+        )
+        return total - len(connected)
 
-        for call in method.calls():
-            if call == name:
-                continue
-            result |= self.__follow_call(ref, call)
 
-        return result
+class LCOM2(PairwiseAlgorithm):
+    def name(self):
+        return 'LCOM2'
+
+    def measure(self, graph):
+        total, connected = self.pairs(
+            method.vars for method in graph.members()
+        )
+        return max(total - 2 * len(connected), 0)
+
+
+class LCOM3(PairwiseAlgorithm):
+    def name(self):
+        return 'LCOM3'
+
+    def measure(self, graph):
+        members = graph.members()
+        total, connected = self.pairs(method.vars for method in members)
+        return len(self.components(len(members), connected))
+
+
+class LCOM5(LCOMAlgorithm):
+    def name(self):
+        return 'LCOM5'
+
+    def measure(self, graph):
+        members = graph.members()
+        usage = defaultdict(int)
+        for method in members:
+            for attr in method.vars:
+                usage[attr] += 1
+
+        if len(members) < 2 or not usage:
+            return 0.0
+
+        average = float(sum(usage.values())) / len(usage)
+        return (average - len(members)) / (1 - len(members))
+
+
+class TCC(PairwiseAlgorithm):
+    def name(self):
+        return 'TCC'
+
+    def measure(self, graph):
+        total, connected = self.pairs(
+            graph.usage(method) for method in graph.members()
+        )
+        if not total:
+            return 0.0
+        return float(len(connected)) / total
+
+
+class LCC(PairwiseAlgorithm):
+    def name(self):
+        return 'LCC'
+
+    def measure(self, graph):
+        members = graph.members()
+        total, connected = self.pairs(
+            graph.usage(method) for method in members
+        )
+        if not total:
+            return 0.0
+
+        indirect = sum(
+            len(group) * (len(group) - 1) // 2
+            for group in self.components(len(members), connected).groups()
+        )
+        return float(indirect) / total
+
+
+class LCOM4(LCOMAlgorithm):
+    def name(self):
+        return 'LCOM4'
 
-    def __match_groups(self, groups):
+    def measure(self, graph):
+        components = DisjointSet()
+        for method, name in graph.edges():
+            components.union(method, name)
+
+        return len(components)
+
+
+class BitsetLCOM4(LCOM4):
+    def measure(self, graph):
+        bits = defaultdict(lambda: 1 << len(bits))
+        paths = defaultdict(int)
+        for method, name in graph.edges():
+            paths[method] |= bits[method] | bits[name]
+
+        return self.components(list(paths.values()), len(bits))
+
+    def components(self, paths, size):
         result = list()
+        seen = 0
+        for path in paths:
+            if not path & seen:
+                result.append(path)
+                seen |= path
+                continue
 
-        for group in groups:
-            match = self.__find_matching_group(group, result)
-            match |= group
+            seen |= path
+            merged = path
+            rest = list()
+            for component in result:
+                if component & path:
+                    merged |= component
+                else:
+                    rest.append(component)
+            rest.append(merged)
+            result = rest
+        return len(result)
 
-        return result
 
-    def __find_matching_group(self, path, groups):
-        for other in groups:
-            if other & path:
-                return other
+class NumpyLCOM4(BitsetLCOM4):
+    def __init__(self):
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        self.__numpy = numpy
+
+    def measure(self, graph):
+        np = self.__numpy
+        if np is None:
+            return super(NumpyLCOM4, self).measure(graph)
+
+        ids = defaultdict(lambda: len(ids))
+        edges = [(ids[method], ids[name]) for method, name in graph.edges()]
+        if not edges:
+            return 0
+
+        edges = np.array(edges, dtype=np.intp)
+        return self.__count(np, edges[:, 0], edges[:, 1], len(ids))
 
-        other = set()
-        groups.append(other)
-        return other
+    def __count(self, np, left, right, size):
+        labels = np.arange(size)
+        while True:
+            lowest = np.minimum(labels[left], labels[right])
+            np.minimum.at(labels, labels[left], lowest)
+            np.minimum.at(labels, labels[right], lowest)
+            while True:
+                jumped = labels[labels]
+                if (jumped == labels).all():
+                    break
+                labels = jumped
+            if (labels[left] == labels[right]).all():
+                return len(np.unique(labels))
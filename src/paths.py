@@ -0,0 +1,12 @@
+import os
+
+
+class Paths(object):
+    @classmethod
+    def within(cls, file, paths):
+        file = os.path.abspath(file)
+        for path in paths:
+            path = os.path.abspath(path).rstrip(os.path.sep) + os.path.sep
+            if file == path[:-1] or file.startswith(path):
+                return True
+        return False
@@ -0,0 +1,139 @@
+import ast
+import heapq
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class NullProfiler(object):
+    class Stage(object):
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+    STAGE = Stage()
+
+    def enabled(self):
+        return False
+
+    def stage(self, name, file=None, cls=None):
+        return self.STAGE
+
+    def iterate(self, name, iterable):
+        return iterable
+
+    def nodes(self, file, node):
+        pass
+
+    def report(self, stream=None):
+        pass
+
+
+class Profiler(NullProfiler):
+    STAGES = ('discover', 'read', 'parse', 'extract', 'score')
+
+    def __init__(self, top=10):
+        self.__top = top
+        self.__stages = defaultdict(lambda: [0.0, 0.0])
+        self.__files = defaultdict(lambda: [0.0, 0, 0])
+        self.__classes = defaultdict(float)
+
+    def enabled(self):
+        return True
+
+    @contextmanager
+    def stage(self, name, file=None, cls=None):
+        wall, cpu = time.time(), self.__cpu()
+        try:
+            yield self
+        finally:
+            wall, cpu = time.time() - wall, self.__cpu() - cpu
+            self.__stages[name][0] += wall
+            self.__stages[name][1] += cpu
+            if file is not None:
+                self.__files[file][0] += wall
+            if cls is not None:
+                self.__classes[cls] += wall
+
+    def iterate(self, name, iterable):
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    elem = next(iterator)
+                except StopIteration:
+                    return
+            yield elem
+
+    def nodes(self, file, node):
+        stats = self.__files[file]
+        for elem in ast.walk(node):
+            stats[2] += 1
+            if isinstance(elem, ast.ClassDef):
+                stats[1] += 1
+
+    def stages(self):
+        return {
+            name: tuple(self.__stages[name])
+            for name in self.STAGES
+            if name in self.__stages
+        }
+
+    def files(self):
+        return {
+            file: tuple(elem)
+            for file, elem in self.__files.items()
+        }
+
+    def classes(self):
+        return dict(self.__classes)
+
+    def report(self, stream=None):
+        stream = stream or sys.stderr
+        write = stream.write
+
+        write('\nProfile\n')
+        write('%-10s %10s %10s\n' % ('Stage', 'Wall', 'CPU'))
+        total = [0.0, 0.0]
+        for name, (wall, cpu) in sorted(
+            self.stages().items(),
+            key=lambda x: self.STAGES.index(x[0])
+        ):
+            total[0] += wall
+            total[1] += cpu
+            write('%-10s %9.4fs %9.4fs\n' % (name, wall, cpu))
+        write('%-10s %9.4fs %9.4fs\n' % ('Total', total[0], total[1]))
+
+        files = self.files()
+        write('\nFiles: %d, classes: %d, nodes: %d\n' % (
+            len(files),
+            sum(elem[1] for elem in files.values()),
+            sum(elem[2] for elem in files.values()),
+        ))
+
+        write('\nSlowest files\n')
+        for file, (wall, classes, nodes) in heapq.nlargest(
+            self.__top,
+            files.items(),
+            key=lambda x: x[1][0]
+        ):
+            write('%9.4fs %s (%d classes, %d nodes)\n' % (
+                wall, file, classes, nodes
+            ))
+
+        write('\nSlowest classes\n')
+        for name, wall in heapq.nlargest(
+            self.__top,
+            self.__classes.items(),
+            key=lambda x: x[1]
+        ):
+            write('%9.4fs %s\n' % (wall, name))
+
+    def __cpu(self):
+        try:
+            return time.process_time()
+        except AttributeError:  # pragma: no cover
+            return time.clock()
@@ -0,0 +1,64 @@
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from src.reflection import ModuleReflection
+
+
+class SourceError(Exception):
+    pass
+
+
+class JSONLinesReader(object):
+    def read(self, stream):
+        for number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise SourceError('Invalid JSON on line %d: %s' % (number, e))
+
+            if not isinstance(record, dict) or 'source' not in record:
+                raise SourceError('Missing source on line %d' % number)
+
+            if record.get('name'):
+                name = record['name']
+            elif record.get('file'):
+                name = ModuleReflection.module_name(record['file'])
+            else:
+                raise SourceError('Missing name on line %d' % number)
+
+            yield name, record['source']
+
+
+class BulkReader(object):
+    def __init__(self, workers=8, window=None, opener=open, tolerant=False):
+        self.__workers = workers
+        self.__window = window or workers * 4
+        self.__opener = opener
+        self.__tolerant = tolerant
+
+    def read(self, files):
+        pending = deque()
+        with ThreadPoolExecutor(self.__workers) as pool:
+            for file in files:
+                pending.append((file, pool.submit(self.__read, file)))
+                if len(pending) >= self.__window:
+                    file, future = pending.popleft()
+                    yield file, future.result()
+
+            while pending:
+                file, future = pending.popleft()
+                yield file, future.result()
+
+    def __read(self, file):
+        path = ModuleReflection.normalize_path(file)
+        try:
+            with self.__opener(path, 'rb') as handle:
+                return handle.read()
+        except (IOError, OSError) as e:
+            if not self.__tolerant:
+                raise
+            return e
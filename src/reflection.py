@@ -1,8 +1,14 @@
 import ast
 from abc import ABCMeta, abstractmethod
+from collections import namedtuple, OrderedDict
 
 import os
 
+try:
+    from sys import intern
+except ImportError:  # pragma: no cover
+    pass
+
 
 class ReflectionError(Exception):
     pass
@@ -19,11 +25,18 @@ class Reflection(object):
 class ModuleReflection(Reflection):
     @classmethod
     def from_file(cls, file):
-        file = file.replace('/', os.path.sep).replace('\\', os.path.sep)
-        with open(file, 'r') as handle:
+        with open(cls.normalize_path(file), 'rb') as handle:
             content = handle.read()
 
-        name = file.rsplit('.', 1)[0]
+        return cls.from_string(cls.module_name(file), content)
+
+    @classmethod
+    def normalize_path(cls, file):
+        return file.replace('/', os.path.sep).replace('\\', os.path.sep)
+
+    @classmethod
+    def module_name(cls, file):
+        name = cls.normalize_path(file).rsplit('.', 1)[0]
         replacements = (
             (os.path.sep, '.'),
             ('__init__', ''),
@@ -32,146 +45,258 @@ class ModuleReflection(Reflection):
         for needle, replace in replacements:
             name = name.replace(needle, replace)
 
-        return cls.from_string(name.strip('.'), content)
+        return name.strip('.')
 
     @classmethod
     def from_string(cls, name, content):
         return cls(name, ast.parse(content))
 
     def __init__(self, name, node):
-        self.__name = name
-        self.__node = node
+        self.__name = intern(name)
+        self.__classes = ModuleIndexer().index(node)
+        self.__reflections = None
+        self.__table = None
 
     def name(self):
         return self.__name
 
     def class_by_name(self, name):
-        for elem in self.classes():
-            if elem.name() == name:
-                return elem
-        raise ReflectionError('Unknown class %s' % name)
+        self.__class_table()
+        try:
+            return self.__table[name]
+        except KeyError:
+            raise ReflectionError('Unknown class %s' % name)
 
     def classes(self):
-        return [
-            ClassReflection(self.__name, node)
-            for node in ast.walk(self.__node)
-            if isinstance(node, ast.ClassDef)
-        ]
+        return list(self.__class_table())
+
+    def __class_table(self):
+        if self.__reflections is None:
+            self.__reflections = tuple(
+                ClassReflection(self.__name, index)
+                for index in self.__classes
+            )
+            self.__table = dict()
+            for elem in self.__reflections:
+                self.__table.setdefault(elem.name(), elem)
+        return self.__reflections
+
+
+MethodIndex = namedtuple(
+    'MethodIndex',
+    ['name', 'decorators', 'vars', 'calls']
+)
+ClassIndex = namedtuple('ClassIndex', ['name', 'vars', 'methods'])
+
+
+class ModuleIndexer(ast.NodeVisitor):
+    def __init__(self):
+        self.__scope = list()
+        self.__classes = list()
+
+    def index(self, node):
+        self.visit(node)
+        return tuple(self.__classes)
+
+    def visit_ClassDef(self, node):
+        self.__index(node, self.__scope)
+
+    def visit_FunctionDef(self, node):
+        self.__scope.append(node.name)
+        self.generic_visit(node)
+        self.__scope.pop()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def __index(self, node, scope):
+        name = '.'.join(scope + [node.name])
+        indexer = ClassIndexer()
+        self.__classes.append(indexer.index(node, name))
+        for path, child in indexer.nested():
+            self.__index(child, [name] + path)
+
+
+class ClassIndexer(ast.NodeVisitor):
+    SCOPES = ('cls', 'self')
+    INSTANCE = 'self'
+
+    def __init__(self):
+        self.__instance_vars = set()
+        self.__vars = None
+        self.__calls = None
+        self.__scope = list()
+        self.__shadowed = 0
+        self.__nested = list()
+
+    def nested(self):
+        return list(self.__nested)
+
+    def index(self, node, name=None):
+        class_vars = set()
+        methods = list()
+
+        for child in node.body:
+            if isinstance(child, ast.Assign):
+                class_vars |= {
+                    target.id
+                    for target in child.targets
+                    if isinstance(target, ast.Name)
+                }
+
+            if not isinstance(child, ast.FunctionDef):
+                self.visit(child)
+                continue
+
+            self.__vars = set()
+            self.__calls = set()
+            self.__scope.append(child.name)
+            self.generic_visit(child)
+            self.__scope.pop()
+            methods.append(MethodIndex(
+                intern(child.name),
+                tuple(intern(self.__decorator_name(elem))
+                      for elem in child.decorator_list),
+                self.__names(self.__vars - self.__calls),
+                self.__names(self.__calls)
+            ))
+            self.__vars = self.__calls = None
+
+        class_vars |= self.__instance_vars
+        class_vars -= {method.name for method in methods}
+        return ClassIndex(
+            intern(name or node.name),
+            self.__names(class_vars),
+            tuple(methods)
+        )
+
+    def visit_ClassDef(self, node):
+        self.__nested.append((list(self.__scope), node))
+
+    def visit_FunctionDef(self, node):
+        self.__scope.append(node.name)
+        self.__visit_scope(node)
+        self.__scope.pop()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Lambda(self, node):
+        self.__visit_scope(node)
+
+    def visit_Attribute(self, node):
+        owner = None if self.__shadowed else getattr(node.value, 'id', None)
+        if owner == self.INSTANCE:
+            self.__instance_vars.add(node.attr)
+        if self.__vars is not None and owner in self.SCOPES:
+            self.__vars.add(node.attr)
+        self.generic_visit(node)
+
+    def visit_Call(self, node):
+        func = node.func
+        if self.__calls is not None \
+                and not self.__shadowed \
+                and isinstance(func, ast.Attribute) \
+                and getattr(func.value, 'id', None) in self.SCOPES:
+            self.__calls.add(func.attr)
+        self.generic_visit(node)
+
+    def __visit_scope(self, node):
+        shadowed = self.__vars is not None and self.__binds(node)
+        self.__shadowed += shadowed
+        self.generic_visit(node)
+        self.__shadowed -= shadowed
+
+    def __binds(self, node):
+        args = node.args
+        params = list(args.args)
+        params += getattr(args, 'posonlyargs', [])
+        params += getattr(args, 'kwonlyargs', [])
+        params += [elem for elem in (args.vararg, args.kwarg) if elem]
+        return any(
+            getattr(elem, 'arg', getattr(elem, 'id', elem)) in self.SCOPES
+            for elem in params
+        )
+
+    def __names(self, names):
+        return frozenset(intern(name) for name in names)
+
+    def __decorator_name(self, node):
+        if isinstance(node, ast.Call):
+            return self.__decorator_name(node.func)
+        if isinstance(node, ast.Attribute):
+            return '%s.%s' % (self.__decorator_name(node.value), node.attr)
+        return getattr(node, 'id', '')
 
 
 class ClassReflection(Reflection):
-    def __init__(self, module_name, node):
+    def __init__(self, module_name, index):
         self.__module_name = module_name
-        self.__node = node
+        self.__index = index
+        self.__methods = None
+
+    @classmethod
+    def from_node(cls, module_name, node):
+        return cls(module_name, ClassIndexer().index(node))
 
     def name(self):
         return '%s.%s' % (
             self.__module_name,
-            self.__node.name
+            self.__index.name
         )
 
     def method_by_name(self, name):
-        nodes = [
-            node
-            for node in self.__class_methods()
-            if node.name == name
-        ]
-
         try:
-            return MethodReflection(
-                self.__module_name,
-                self.__node.name,
-                nodes[0]
-            )
-        except IndexError:
+            return self.__method_table()[name]
+        except KeyError:
             raise ReflectionError('Unknown method %s' % name)
 
     def methods(self):
-        return [
-            MethodReflection(self.__module_name, self.__node.name, node)
-            for node in self.__class_methods()
-        ]
+        return list(self.__method_table().values())
 
     def vars(self):
-        result = self.__class_vars()
-        result |= self.__instance_vars()
-        result -= {node.name for node in self.__class_methods()}
-        return list(result)
-
-    def __class_vars(self):
-        return {
-            target.id
-            for node in self.__node.body
-            if isinstance(node, ast.Assign)
-            for target in node.targets
-        }
-
-    def __instance_vars(self):
-        return {
-            node.attr
-            for node in ast.walk(self.__node)
-            if isinstance(node, ast.Attribute) and node.value.id == 'self'
-        }
-
-    def __class_methods(self):
-        return {
-            node
-            for node in self.__node.body
-            if isinstance(node, ast.FunctionDef)
-        }
+        return list(self.__index.vars)
+
+    def __method_table(self):
+        if self.__methods is None:
+            self.__methods = OrderedDict(
+                (
+                    method.name,
+                    MethodReflection(
+                        self.__module_name,
+                        self.__index.name,
+                        method
+                    )
+                )
+                for method in self.__index.methods
+            )
+        return self.__methods
 
 
 class MethodReflection(Reflection):
-    def __init__(self, module_name, class_name, node):
+    def __init__(self, module_name, class_name, index):
         self.__module_name = module_name
         self.__class_name = class_name
-        self.__node = node
+        self.__index = index
 
     def name(self):
-        return self.__call_name(self.__node.name)
+        return self.__call_name(self.__index.name)
 
     def is_constructor(self):
-        return self.__node.name == '__init__'
+        return self.__index.name == '__init__'
 
     def is_loose(self):
-        return not (self.__calls() | self.__vars())
+        return not (self.__index.calls or self.__index.vars)
 
     def has_decorator(self, decorator_name):
-        if not hasattr(self.__node, 'decorator_list'):
-            return False
-
-        for decorator in self.__node.decorator_list:
-            if decorator.id == decorator_name:
-                return True
-        return False
+        return decorator_name in self.__index.decorators
 
     def calls(self):
         return [
             self.__call_name(call)
-            for call in self.__calls()
+            for call in self.__index.calls
         ]
 
     def vars(self):
-        return list(self.__vars() - self.__calls())
-
-    def __vars(self):
-        return {
-            node.attr
-            for node in ast.walk(self.__node)
-            if isinstance(node, ast.Attribute)
-            and hasattr(node.value, 'id')
-            and node.value.id in ('cls', 'self')
-        }
-
-    def __calls(self):
-        return {
-            node.func.attr
-            for node in ast.walk(self.__node)
-            if isinstance(node, ast.Call)
-            and isinstance(node.func, ast.Attribute)
-            and hasattr(node.func.value, 'id')
-            and node.func.value.id in ('cls', 'self')
-        }
+        return list(self.__index.vars)
 
     def __call_name(self, node_name):
         return '%s.%s::%s' % (
@@ -0,0 +1,109 @@
+import math
+
+
+class Histogram(object):
+    def __init__(self, edges):
+        self.__edges = tuple(edges)
+        self.__counts = [0] * (len(self.__edges) + 1)
+
+    def add(self, value):
+        index = 0
+        while index < len(self.__edges) and value >= self.__edges[index]:
+            index += 1
+        self.__counts[index] += 1
+
+    def counts(self):
+        return list(self.__counts)
+
+    def labels(self):
+        result = ['<%g' % self.__edges[0]]
+        for lower, upper in zip(self.__edges, self.__edges[1:]):
+            result.append('%g-%g' % (lower, upper))
+        result.append('%g+' % self.__edges[-1])
+        return result
+
+    def lower(self, index):
+        if index == 0:
+            return float('-inf')
+        return self.__edges[index - 1]
+
+
+class Summary(object):
+    def __init__(self, edges):
+        self.__count = 0
+        self.__total = 0
+        self.__minimum = None
+        self.__maximum = None
+        self.__histogram = Histogram(edges)
+
+    def add(self, value):
+        self.__count += 1
+        self.__total += value
+        if self.__minimum is None or value < self.__minimum:
+            self.__minimum = value
+        if self.__maximum is None or value > self.__maximum:
+            self.__maximum = value
+        self.__histogram.add(value)
+
+    def count(self):
+        return self.__count
+
+    def average(self):
+        if not self.__count:
+            return 0
+        return float(self.__total) / self.__count
+
+    def minimum(self):
+        return self.__minimum
+
+    def maximum(self):
+        return self.__maximum
+
+    def histogram(self):
+        return self.__histogram
+
+    def percentile(self, q):
+        if not self.__count:
+            return None
+
+        rank = max(1, int(math.ceil(q * self.__count)))
+        seen = 0
+        for index, count in enumerate(self.__histogram.counts()):
+            seen += count
+            if seen >= rank:
+                break
+        lower = self.__histogram.lower(index)
+        return min(max(lower, self.__minimum), self.__maximum)
+
+
+class Rollup(object):
+    INTEGERS = (1, 2, 3, 4, 5, 10, 20)
+    FRACTIONS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+    PERCENTILES = (0.5, 0.9)
+
+    def __init__(self, edges=INTEGERS, depth=None):
+        self.__edges = tuple(edges)
+        self.__depth = depth
+        self.__nodes = dict()
+
+    def add(self, module, score):
+        if isinstance(score, (tuple, list)):
+            score = score[0]
+
+        parts = module.split('.') if module else ['']
+        depth = len(parts)
+        if self.__depth is not None:
+            depth = min(depth, self.__depth)
+
+        for index in range(1, depth + 1):
+            name = '.'.join(parts[:index])
+            node = self.__nodes.get(name)
+            if node is None:
+                node = self.__nodes[name] = Summary(self.__edges)
+            node.add(score)
+
+    def nodes(self):
+        return sorted(self.__nodes.items())
+
+    def labels(self):
+        return Histogram(self.__edges).labels()
@@ -0,0 +1,174 @@
+import json
+import os
+import socket
+import stat
+from collections import OrderedDict
+
+try:
+    from socketserver import StreamRequestHandler, UnixStreamServer
+except ImportError:  # pragma: no cover
+    from SocketServer import StreamRequestHandler, UnixStreamServer
+
+
+class ServerError(Exception):
+    pass
+
+
+class LRUCache(object):
+    def __init__(self, size=1024):
+        self.__size = size
+        self.__entries = OrderedDict()
+
+    def get(self, key):
+        try:
+            value = self.__entries.pop(key)
+        except KeyError:
+            return None
+        self.__entries[key] = value
+        return value
+
+    def set(self, key, value):
+        self.__entries.pop(key, None)
+        self.__entries[key] = value
+        while len(self.__entries) > self.__size:
+            self.__entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+class ScoreService(object):
+    def __init__(self, lcom, scorer, cache=None):
+        self.__lcom = lcom
+        self.__scorer = scorer
+        self.__cache = cache if cache is not None else LRUCache()
+
+    def query(self, request):
+        if not isinstance(request, dict) or 'file' not in request:
+            return {'error': 'Invalid request'}
+
+        file = request['file']
+        try:
+            scores = self.__scores(file, request.get('cwd') or os.getcwd())
+        except (IOError, OSError) as e:
+            return {'error': 'Unable to read %s: %s' % (file, e)}
+        except SyntaxError as e:
+            return {'error': 'Unable to parse %s: %s' % (file, e)}
+        except Exception as e:
+            return {'error': 'Unable to score %s: %s: %s' % (
+                file, e.__class__.__name__, e
+            )}
+
+        name = request.get('class')
+        if name is not None:
+            scores = [elem for elem in scores if elem[0] == name]
+            if not scores:
+                return {'error': 'Unknown class %s' % name}
+
+        return {
+            'algorithm': self.__lcom.name(),
+            'scores': [[name, score] for name, score in scores],
+        }
+
+    def __scores(self, file, cwd):
+        from src.reflection import ModuleReflection
+
+        path = os.path.join(cwd, ModuleReflection.normalize_path(file))
+        stat = os.stat(path)
+        stamp = (stat.st_mtime, stat.st_size)
+        key = (path, file)
+
+        entry = self.__cache.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+
+        with open(path, 'rb') as handle:
+            scores = self.__scorer.content(file, handle.read())
+        self.__cache.set(key, (stamp, scores))
+        return scores
+
+
+class ScoreHandler(StreamRequestHandler):
+    def handle(self):
+        for line in iter(self.rfile.readline, b''):
+            try:
+                request = json.loads(line.decode('utf-8'))
+            except ValueError:
+                response = {'error': 'Invalid request'}
+            else:
+                response = self.server.service.query(request)
+
+            self.wfile.write((json.dumps(response) + '\n').encode('utf-8'))
+            self.wfile.flush()
+
+
+class ScoreServer(UnixStreamServer):
+    def __init__(self, path, service):
+        self.service = service
+        self.__remove_stale(path)
+        UnixStreamServer.__init__(self, path, ScoreHandler)
+
+    def server_close(self):
+        UnixStreamServer.server_close(self)
+        try:
+            os.remove(self.server_address)
+        except OSError:
+            pass
+
+    def __remove_stale(self, path):
+        try:
+            mode = os.lstat(path).st_mode
+        except OSError:
+            return
+
+        if not stat.S_ISSOCK(mode):
+            raise ServerError('%s exists and is not a socket' % path)
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except (IOError, OSError):
+            os.remove(path)
+            return
+        finally:
+            probe.close()
+        raise ServerError('%s is used by a running server' % path)
+
+
+class Client(object):
+    def __init__(self, path, timeout=5.0):
+        self.__path = path
+        self.__timeout = timeout
+
+    def query(self, file, name=None, cwd=None):
+        request = {'file': file, 'cwd': cwd or os.getcwd()}
+        if name is not None:
+            request['class'] = name
+
+        response = self.__send(request)
+        if 'error' in response:
+            raise ServerError(response['error'])
+
+        return response['algorithm'], [
+            (name, tuple(score) if isinstance(score, list) else score)
+            for name, score in response['scores']
+        ]
+
+    def __send(self, request):
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(self.__timeout)
+        try:
+            connection.connect(self.__path)
+            connection.sendall((json.dumps(request) + '\n').encode('utf-8'))
+            stream = connection.makefile('rb')
+            line = stream.readline()
+            stream.close()
+        except (IOError, OSError) as e:
+            raise ServerError('Unable to query %s: %s' % (self.__path, e))
+        finally:
+            connection.close()
+
+        try:
+            return json.loads(line.decode('utf-8'))
+        except ValueError:
+            raise ServerError('Invalid response from %s' % self.__path)
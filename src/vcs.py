@@ -0,0 +1,54 @@
+import os
+import subprocess
+
+from src.paths import Paths
+
+
+class GitError(Exception):
+    pass
+
+
+class Git(object):
+    def __init__(self, executable='git', cwd=None):
+        self.__executable = executable
+        self.__cwd = cwd
+
+    def changed_files(self, since='HEAD', paths=()):
+        root = os.path.normpath(
+            self.__run('rev-parse', '--show-toplevel').strip()
+        )
+        result = set(self.__paths(self.__run(
+            'diff', '--name-only', '-z', '--diff-filter=d', since, '--',
+            cwd=root
+        )))
+        result |= set(self.__paths(self.__run(
+            'ls-files', '--others', '--exclude-standard', '-z', cwd=root
+        )))
+
+        cwd = os.path.realpath(self.__cwd or os.curdir)
+        paths = [os.path.realpath(os.path.join(cwd, path)) for path in paths]
+        return sorted(
+            os.path.relpath(file, cwd)
+            for file in (os.path.join(root, elem) for elem in result)
+            if not paths or Paths.within(file, paths)
+        )
+
+    def __run(self, *args, **kwargs):
+        try:
+            process = subprocess.Popen(
+                (self.__executable,) + args,
+                cwd=kwargs.get('cwd', self.__cwd),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+        except OSError as e:
+            raise GitError('Unable to run git: %s' % e)
+
+        out, err = process.communicate()
+        if process.returncode:
+            raise GitError(err.decode('utf-8', 'replace').strip())
+
+        return out.decode('utf-8')
+
+    def __paths(self, output):
+        return [elem for elem in output.split('\0') if elem]
@@ -0,0 +1,93 @@
+import hashlib
+import os
+from collections import OrderedDict, namedtuple
+
+from src.paths import Paths
+from src.reflection import ModuleReflection
+
+ScoreChange = namedtuple('ScoreChange', ['name', 'before', 'after'])
+WatchedFile = namedtuple('WatchedFile', ['stamp', 'digest', 'scores'])
+
+
+class Watcher(object):
+    def __init__(self, fs, scorer, files=()):
+        self.__fs = fs
+        self.__scorer = scorer
+        self.__files = OrderedDict(files)
+
+    def poll(self, paths, filter=None):
+        changes = list()
+        errors = list()
+        seen = set()
+        for path in paths:
+            for file in self.__fs.files(path, filter):
+                file = os.path.normpath(file)
+                seen.add(file)
+                changes += self.__check(file, errors)
+
+        for file in [
+            elem
+            for elem in self.__files
+            if elem not in seen and Paths.within(elem, paths)
+        ]:
+            changes += self.__diff(self.__files.pop(file).scores, [])
+
+        return changes, errors
+
+    def files(self):
+        return list(self.__files.items())
+
+    def scores(self):
+        result = list()
+        for elem in self.__files.values():
+            result += elem.scores
+        return result
+
+    def __check(self, file, errors):
+        path = ModuleReflection.normalize_path(file)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return []
+
+        stamp = (stat.st_mtime, stat.st_size)
+        entry = self.__files.get(file)
+        if entry is not None and entry.stamp == stamp:
+            return []
+
+        try:
+            with open(path, 'rb') as handle:
+                content = handle.read()
+        except (IOError, OSError):
+            return []
+
+        digest = hashlib.sha1(content).hexdigest()
+        before = entry.scores if entry is not None else []
+        if entry is not None and entry.digest == digest:
+            self.__files[file] = entry._replace(stamp=stamp)
+            return []
+
+        try:
+            after = self.__scorer.content(file, content)
+        except SyntaxError as e:
+            skipped = [(file, str(e))]
+            after = before
+        else:
+            skipped = getattr(after, 'skipped', [])
+            if skipped and not after:
+                after = before
+
+        errors += skipped
+        if skipped:  # forget the digest so the file is scored again
+            digest = None
+        self.__files[file] = WatchedFile(stamp, digest, after)
+        return self.__diff(before, after)
+
+    def __diff(self, before, after):
+        old = OrderedDict(before)
+        new = OrderedDict(after)
+        result = list()
+        for name in list(old) + [elem for elem in new if elem not in old]:
+            if old.get(name) != new.get(name):
+                result.append(ScoreChange(name, old.get(name), new.get(name)))
+        return result
@@ -118,3 +118,37 @@ class Reflection:
 
     def loose(self):
         return 0
+
+
+class Bridged:
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def a(self):
+        return self.x
+
+    def b(self):
+        return self.y
+
+    def c(self):
+        return self.z
+
+    def d(self):
+        return self.x + self.y + self.z
+
+
+class Recursive:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def a(self):
+        return self.b()
+
+    def b(self):
+        return self.a() + self.x
+
+    def c(self):
+        return self.c() + self.y
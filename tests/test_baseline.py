@@ -0,0 +1,67 @@
+import json
+import os
+
+from pytest import raises
+
+from src.baseline import Baseline, BaselineError
+from src.watch import WatchedFile
+
+
+class TestBaseline(object):
+    def setup_method(self):
+        self.files = [
+            (os.path.join('foo', 'bar.py'), WatchedFile(
+                (1.0, 10), 'abc', [('foo.bar.Bar', 1), ('foo.bar.Baz', 2)]
+            )),
+            ('suite.py', WatchedFile(None, 'def', [('suite.Foo', (1, 0.5))])),
+        ]
+
+    def test_load_missing_file(self, tmpdir):
+        result = Baseline.load(str(tmpdir.join('missing.json')), 'LCOM4')
+
+        assert result.files() == []
+
+    def test_save_and_load(self, tmpdir):
+        path = str(tmpdir.join('baseline.json'))
+
+        Baseline('LCOM4', self.files).save(path)
+        result = Baseline.load(path, 'LCOM4')
+
+        assert result.files() == [
+            (os.path.join('foo', 'bar.py'), WatchedFile(
+                None, 'abc', [('foo.bar.Bar', 1), ('foo.bar.Baz', 2)]
+            )),
+            ('suite.py', WatchedFile(None, 'def', [('suite.Foo', (1, 0.5))])),
+        ]
+
+    def test_save_uses_forward_slashes(self, tmpdir):
+        path = str(tmpdir.join('baseline.json'))
+
+        Baseline('LCOM4', self.files).save(path)
+
+        with open(path, 'r') as handle:
+            assert sorted(json.load(handle)['files']) == [
+                'foo/bar.py', 'suite.py'
+            ]
+
+    def test_load_rejects_other_algorithm(self, tmpdir):
+        path = str(tmpdir.join('baseline.json'))
+        Baseline('LCOM4', self.files).save(path)
+
+        with raises(BaselineError) as e:
+            Baseline.load(path, 'LCOM1')
+        assert 'recorded with LCOM4' in str(e.value)
+
+    def test_load_rejects_invalid_file(self, tmpdir):
+        path = tmpdir.join('baseline.json')
+        path.write('{"version": 1, "algorithm": "LCOM4", "files": []}')
+
+        with raises(BaselineError):
+            Baseline.load(str(path), 'LCOM4')
+
+    def test_load_rejects_malformed_json(self, tmpdir):
+        path = tmpdir.join('baseline.json')
+        path.write('{')
+
+        with raises(BaselineError):
+            Baseline.load(str(path), 'LCOM4')
@@ -0,0 +1,74 @@
+import os
+
+from src.cache import ResultCache
+
+
+class TestResultCache(object):
+    def setup_method(self):
+        self.scores = [('foo.Bar', 1), ('foo.Baz', 2)]
+
+    def test_get_missing_entry(self, tmpdir):
+        cache = ResultCache(str(tmpdir), 'LCOM4')
+
+        assert cache.get(cache.key('foo', b'')) is None
+
+    def test_set_and_get(self, tmpdir):
+        cache = ResultCache(str(tmpdir), 'LCOM4')
+        key = cache.key('foo', b'class Bar: pass')
+
+        cache.set(key, self.scores)
+
+        assert cache.get(key) == self.scores
+
+    def test_set_and_get_tuples(self, tmpdir):
+        cache = ResultCache(str(tmpdir), 'LCOM4,TCC')
+        key = cache.key('foo', b'class Bar: pass')
+
+        cache.set(key, [('foo.Bar', (1, 0.5))])
+
+        assert cache.get(key) == [('foo.Bar', (1, 0.5))]
+
+    def test_key_depends_on_content_name_and_algorithm(self, tmpdir):
+        cache = ResultCache(str(tmpdir), 'LCOM4')
+        other = ResultCache(str(tmpdir), 'LCOM5')
+
+        keys = {
+            cache.key('foo', b'a'),
+            cache.key('foo', b'b'),
+            cache.key('bar', b'a'),
+            other.key('foo', b'a'),
+        }
+
+        assert len(keys) == 4
+
+    def test_ignores_corrupt_entry(self, tmpdir):
+        cache = ResultCache(str(tmpdir), 'LCOM4')
+        key = cache.key('foo', b'')
+        cache.set(key, self.scores)
+
+        path = os.path.join(str(tmpdir), key[:2], '%s.json' % key)
+        with open(path, 'w') as handle:
+            handle.write('{"key": ')
+
+        assert cache.get(key) is None
+
+    def test_ignores_entry_stored_under_other_key(self, tmpdir):
+        cache = ResultCache(str(tmpdir), 'LCOM4')
+        key = cache.key('foo', b'')
+        cache.set(key, self.scores)
+
+        path = os.path.join(str(tmpdir), key[:2], '%s.json' % key)
+        with open(path, 'w') as handle:
+            handle.write('{"key": "stale", "scores": [["foo.Bar", 1]]}')
+
+        assert cache.get(key) is None
+
+    def test_ignores_unwritable_directory(self, tmpdir):
+        path = tmpdir.join('file')
+        path.write('')
+        cache = ResultCache(str(path), 'LCOM4')
+        key = cache.key('foo', b'')
+
+        cache.set(key, self.scores)
+
+        assert cache.get(key) is None
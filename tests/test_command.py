@@ -1,9 +1,28 @@
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+
+from click.testing import CliRunner
 from mock import patch
+from pytest import raises, skip
 
 from src.command import FileSystem, STDOut, LCOMFactory, PrinterFactory, \
-    Runner, Printer
-from src.lcom import LCOM4, LCOMAlgorithm
-from src.reflection import Reflection
+    Runner, Printer, ModuleScorer, Average, JSONLines, CSV, Gate, main
+from src.cache import ResultCache
+from src.lcom import LCOM4, LCOMAlgorithm, BitsetLCOM4, NumpyLCOM4, \
+    LCOMSuite
+from src.profiler import Profiler
+from src.reader import BulkReader
+from src.reflection import ModuleReflection, Reflection
+from src.rollup import Rollup
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
 
 
 class FakeReflection(Reflection):
@@ -35,19 +54,181 @@ class FakeLCOM(LCOMAlgorithm):
     def calculate(self, ref):
         return self.result
 
+    def measure(self, graph):
+        return self.result
+
 
 class FakePrinter(Printer):
     def __init__(self):
         self.output = []
+        self.algorithm = None
+        self.classes = []
 
-    def render(self, algorithm, classes, average):
+    def start(self, algorithm):
+        self.algorithm = algorithm
+        self.classes = []
+
+    def row(self, name, score):
+        self.classes.append((name, score))
+
+    def finish(self, average):
         self.output.append((
-            algorithm,
-            classes,
+            self.algorithm,
+            self.classes,
             average
         ))
 
 
+class TestImport(object):
+    def test_import_defers_scoring_modules(self):
+        output = subprocess.check_output([
+            sys.executable, '-c',
+            'import sys, src.command; '
+            'print(" ".join(sorted(sys.modules)))'
+        ])
+        modules = set(output.decode('utf-8').split())
+
+        assert 'src.command' in modules
+        assert not modules & {
+            'json', 'csv', 'multiprocessing', 'terminaltables',
+            'src.lcom', 'src.reflection', 'src.cache', 'src.watch',
+            'fnmatch', 'src.ignore',
+        }
+
+    def test_scoring_loads_only_modules_in_use(self):
+        output = subprocess.check_output([
+            sys.executable, '-c',
+            'import atexit, sys; '
+            'atexit.register(lambda: sys.stderr.write('
+            '" ".join(sorted(sys.modules)))); '
+            'from src.command import main; main()',
+            'tests/fixtures.py'
+        ], stderr=subprocess.STDOUT)
+        modules = set(output.decode('utf-8').split())
+
+        assert 'src.lcom' in modules
+        assert not modules & {
+            'json', 'csv', 'multiprocessing', 'subprocess', 'tempfile',
+            'hashlib', 'concurrent.futures', 'src.baseline', 'src.cache',
+            'src.reader', 'src.rollup', 'src.vcs', 'src.watch',
+        }
+
+
+class TestMain(object):
+    def test_scores_paths_by_default(self):
+        result = CliRunner().invoke(main, ['--printer', 'csv', 'src/vcs.py'])
+
+        assert result.exit_code == 0
+        assert 'src.vcs.Git,LCOM4,1' in result.output
+
+    def test_reports_rollup(self):
+        result = CliRunner().invoke(
+            main, ['--printer', 'jsonl', '--rollup', 'src/vcs.py']
+        )
+        records = [json.loads(line) for line in result.output.splitlines()]
+
+        assert result.exit_code == 0
+        assert [
+            elem['name'] for elem in records if elem['type'] == 'rollup'
+        ] == ['src', 'src.vcs']
+
+    def test_fails_when_files_are_skipped(self, tmpdir):
+        tmpdir.join('broken.py').write('class Broken(object:\n')
+        file = str(tmpdir.join('broken.py'))
+
+        result = CliRunner().invoke(main, ['--max-lcom', '5', file])
+        allowed = CliRunner().invoke(main, ['--allow-skipped', file])
+
+        assert result.exit_code == 1
+        assert 'Skipped 1 files or classes:' in result.output
+        assert allowed.exit_code == 0
+
+    def test_baseline_keeps_reporting_broken_files(self, tmpdir, monkeypatch):
+        monkeypatch.chdir(tmpdir)
+        tmpdir.join('pkg', 'a.py').write(
+            'class A(object):\n'
+            '    def a(self):\n'
+            '        return self.x\n'
+            '\n'
+            '    def b(self):\n'
+            '        return self.y\n',
+            ensure=True
+        )
+        args = ['--baseline', 'bl.json', '--max-lcom', '1', 'pkg']
+
+        recorded = CliRunner().invoke(main, args + ['--update-baseline'])
+        tmpdir.join('pkg', 'a.py').write('class A(:\n')
+        updated = CliRunner().invoke(main, args + ['--update-baseline'])
+        rescored = CliRunner().invoke(main, args)
+
+        assert recorded.exit_code == 1
+        assert updated.exit_code == 1
+        assert 'Skipped 1 files or classes:' in updated.output
+        assert rescored.exit_code == 1
+        assert 'Skipped 1 files or classes:' in rescored.output
+
+    def test_repo_average_requires_cache_dir(self):
+        result = CliRunner().invoke(
+            main, ['--changed-only', '--repo-average', 'src']
+        )
+
+        assert result.exit_code == 2
+        assert '--repo-average requires --cache-dir' in result.output
+
+    def test_rollup_cannot_be_combined_with_watch(self):
+        result = CliRunner().invoke(main, ['--rollup', '--watch', 'src'])
+
+        assert result.exit_code == 2
+
+    def changed_repository(self, tmpdir, monkeypatch):
+        def git(*args):
+            subprocess.check_call(('git',) + args, stdout=subprocess.PIPE)
+
+        monkeypatch.chdir(tmpdir)
+        monkeypatch.setenv('GIT_AUTHOR_NAME', 'lcom')
+        monkeypatch.setenv('GIT_AUTHOR_EMAIL', 'lcom@localhost')
+        monkeypatch.setenv('GIT_COMMITTER_NAME', 'lcom')
+        monkeypatch.setenv('GIT_COMMITTER_EMAIL', 'lcom@localhost')
+        git('init', '-q')
+        for name in ('models', 'vendor'):
+            tmpdir.join(name, '%s.py' % name[0]).write(
+                'class Foo(object):\n    pass\n', ensure=True
+            )
+        git('add', '.')
+        git('commit', '-q', '-m', 'initial')
+        for name in ('models', 'vendor'):
+            tmpdir.join(name, '%s.py' % name[0]).write(
+                'class Bar(object):\n    pass\n'
+            )
+
+    def test_changed_only_with_include(self, tmpdir, monkeypatch):
+        self.changed_repository(tmpdir, monkeypatch)
+
+        result = CliRunner().invoke(main, [
+            '--printer', 'csv', '--changed-only', '--include', 'models/*', '.'
+        ])
+
+        assert result.exit_code == 0
+        assert result.output.splitlines()[1:-1] == ['models.m.Bar,LCOM4,0']
+
+    def test_changed_only_with_exclude(self, tmpdir, monkeypatch):
+        self.changed_repository(tmpdir, monkeypatch)
+
+        result = CliRunner().invoke(main, [
+            '--printer', 'csv', '--changed-only', '--exclude', 'vendor', '.'
+        ])
+
+        assert result.exit_code == 0
+        assert result.output.splitlines()[1:-1] == ['models.m.Bar,LCOM4,0']
+
+    def test_lists_commands(self):
+        result = CliRunner().invoke(main, ['--help'])
+
+        assert result.exit_code == 0
+        for command in ('score', 'serve', 'query'):
+            assert command in result.output
+
+
 class TestFileSystem(object):
     def setup_method(self):
         self.fs = FileSystem()
@@ -66,9 +247,20 @@ class TestFileSystem(object):
 
         assert result == {
             'src',
+            'src.baseline',
+            'src.cache',
             'src.command',
+            'src.ignore',
+            'src.isolation',
             'src.lcom',
-            'src.reflection'
+            'src.paths',
+            'src.profiler',
+            'src.reader',
+            'src.reflection',
+            'src.rollup',
+            'src.server',
+            'src.vcs',
+            'src.watch',
         }
 
     def test_find_can_filter_by_file_name(self):
@@ -77,6 +269,313 @@ class TestFileSystem(object):
 
         assert result == {'src.command'}
 
+    def test_files_lists_paths_without_parsing(self):
+        result = list(self.fs.files('src/', 'command.py'))
+
+        assert result == [os.path.join('src/', 'command.py')]
+
+
+class TestFileSystemDiscovery(object):
+    def tree(self, tmpdir, files):
+        for file in files:
+            tmpdir.join(*file.split('/')).ensure()
+        return tmpdir
+
+    def files(self, tmpdir, fs=None):
+        fs = fs or FileSystem()
+        return [
+            os.path.relpath(file, str(tmpdir)).replace(os.path.sep, '/')
+            for file in fs.files(str(tmpdir))
+        ]
+
+    def test_lists_files_in_stable_order(self, tmpdir):
+        self.tree(tmpdir, ['b.py', 'a/z.py', 'a/b/c.py', 'c.txt', 'cpy'])
+
+        assert self.files(tmpdir) == ['b.py', 'a/z.py', 'a/b/c.py']
+
+    def test_prunes_default_directories(self, tmpdir):
+        self.tree(tmpdir, [
+            'pkg/mod.py',
+            '.git/hook.py',
+            '.tox/py36/lib/mod.py',
+            'node_modules/pkg/mod.py',
+            '__pycache__/mod.py',
+            'lcom.egg-info/mod.py',
+            'env/pyvenv.cfg',
+            'env/lib/mod.py',
+        ])
+
+        assert self.files(tmpdir) == ['pkg/mod.py']
+
+    def test_excludes_globs(self, tmpdir):
+        self.tree(tmpdir, [
+            'pkg/mod.py',
+            'pkg/mod_pb2.py',
+            'vendor/lib.py',
+            'pkg/vendor/lib.py',
+        ])
+        fs = FileSystem(exclude=['*_pb2.py', 'vendor'])
+
+        assert self.files(tmpdir, fs) == ['pkg/mod.py']
+
+    def test_excludes_relative_path_globs(self, tmpdir):
+        self.tree(tmpdir, ['pkg/vendor/lib.py', 'vendor/lib.py'])
+        fs = FileSystem(exclude=['pkg/vendor'])
+
+        assert self.files(tmpdir, fs) == ['vendor/lib.py']
+
+    def test_includes_globs(self, tmpdir):
+        self.tree(tmpdir, ['pkg/mod.py', 'pkg/tests/test_mod.py'])
+        fs = FileSystem(include=['test_*.py'])
+
+        assert self.files(tmpdir, fs) == ['pkg/tests/test_mod.py']
+
+    def test_respects_gitignore(self, tmpdir):
+        self.tree(tmpdir, [
+            '.git/HEAD',
+            'pkg/mod.py',
+            'pkg/generated.py',
+            'build/lib/mod.py',
+        ])
+        tmpdir.join('.gitignore').write('build/\n')
+        tmpdir.join('pkg', '.gitignore').write('generated.py\n')
+
+        assert self.files(tmpdir) == ['pkg/mod.py']
+        assert self.files(tmpdir, FileSystem(gitignore=False)) == [
+            'build/lib/mod.py',
+            'pkg/generated.py',
+            'pkg/mod.py',
+        ]
+
+    def test_respects_gitignore_of_parent_directories(self, tmpdir):
+        self.tree(tmpdir, ['.git/HEAD', 'pkg/mod.py', 'pkg/mod_pb2.py'])
+        tmpdir.join('.gitignore').write('*_pb2.py\n')
+
+        assert self.files(tmpdir.join('pkg')) == ['mod.py']
+
+    def test_matches_paths_relative_to_cwd(self, tmpdir, monkeypatch):
+        self.tree(tmpdir, ['pkg/gen/g.py', 'pkg/mod.py'])
+        monkeypatch.chdir(tmpdir)
+        file = os.path.join('pkg', 'gen', 'g.py')
+
+        for pattern, expected in (('pkg/gen/*', []), ('gen/*', [file])):
+            fs = FileSystem(exclude=[pattern])
+
+            assert [elem for elem in fs.files('pkg') if 'gen' in elem] == \
+                expected
+            assert list(fs.files(file)) == expected
+
+    def test_excludes_scanned_directory(self, tmpdir, monkeypatch):
+        self.tree(tmpdir, ['vendor/lib/v.py'])
+        monkeypatch.chdir(tmpdir)
+        fs = FileSystem(exclude=['vendor'])
+
+        assert list(fs.files(os.path.join('vendor', 'lib'))) == []
+
+    def test_filters_explicit_files_by_path(self, tmpdir, monkeypatch):
+        self.tree(tmpdir, [
+            '.git/HEAD',
+            'models/m.py',
+            'vendor/lib/v.py',
+            'build/b.py',
+            'other.py',
+        ])
+        tmpdir.join('.gitignore').write('build/\n')
+        monkeypatch.chdir(tmpdir)
+        files = [
+            os.path.join('models', 'm.py'),
+            os.path.join('vendor', 'lib', 'v.py'),
+            os.path.join('build', 'b.py'),
+            'other.py',
+        ]
+
+        def find(fs):
+            return [elem for file in files for elem in fs.files(file)]
+
+        assert find(FileSystem(include=['models/*'])) == [files[0]]
+        assert find(FileSystem(exclude=['vendor'])) == [files[0], files[3]]
+        assert find(FileSystem(exclude=['vendor'], gitignore=False)) == [
+            files[0], files[2], files[3]
+        ]
+
+
+class TestAverage(object):
+    def test_empty(self):
+        assert Average().value() == 0
+
+    def test_running_average_of_tuples(self):
+        average = Average()
+        average.add((1, 0.5))
+        average.add((2, 1.0))
+
+        assert average.value() == (1.5, 0.75)
+
+    def test_running_average(self):
+        average = Average()
+        for value in (1, 2, 4):
+            average.add(value)
+
+        assert average.value() == 7 / 3.0
+
+
+class TestGate(object):
+    def test_passes_without_thresholds(self):
+        gate = Gate()
+        gate.add('foo.Bar', 10)
+        gate.finish(10)
+
+        assert gate.violations() == []
+
+    def test_fails_on_class_over_max_score(self):
+        gate = Gate(max_score=2)
+        gate.add('foo.Bar', 2)
+        gate.add('foo.Baz', 3)
+
+        assert gate.violations() == ['foo.Baz: 3 exceeds 2']
+
+    def test_fails_on_average_over_max_average(self):
+        gate = Gate(max_average=1.5)
+        gate.finish(2)
+
+        assert gate.violations() == ['Average: 2.00 exceeds 1.5']
+
+    def test_checks_first_metric_of_suite(self):
+        gate = Gate(max_score=2, max_average=2)
+        gate.add('foo.Bar', (3, 0.5))
+        gate.finish((1.0, 3.0))
+
+        assert gate.violations() == ['foo.Bar: 3 exceeds 2']
+
+    def test_stops_only_when_failing_fast(self):
+        gate = Gate(max_score=1)
+        fast = Gate(max_score=1, fail_fast=True)
+        for elem in (gate, fast):
+            elem.add('foo.Bar', 2)
+
+        assert not gate.stopped()
+        assert fast.stopped()
+
+
+class TestModuleScorer(object):
+    def test_score_module(self):
+        result = ModuleScorer(FakeLCOM()).score(FakeReflection())
+
+        assert result == [('FakeReflection', 1)]
+
+    def test_score_file(self):
+        result = ModuleScorer(LCOM4())('tests/fixtures.py')
+
+        assert ('tests.fixtures.Three', 3) in result
+
+    def test_score_file_uses_cache(self, tmpdir):
+        cache = ResultCache(str(tmpdir), 'LCOM4')
+        scorer = ModuleScorer(LCOM4(), cache)
+
+        result = scorer('tests/fixtures.py')
+
+        with open('tests/fixtures.py', 'rb') as handle:
+            key = cache.key('tests.fixtures', handle.read())
+        assert cache.get(key) == result
+
+        cache.set(key, [('tests.fixtures.Cached', 7)])
+        assert scorer('tests/fixtures.py') == [('tests.fixtures.Cached', 7)]
+
+    def test_score_source(self):
+        result = ModuleScorer(LCOM4()).source(
+            'foo', 'class Foo(object):\n    def a(self):\n        self.x\n'
+        )
+
+        assert result == [('foo.Foo', 1)]
+
+    def test_score_source_uses_cache(self, tmpdir):
+        cache = ResultCache(str(tmpdir), 'LCOM4')
+        source = 'class Foo(object):\n    pass\n'
+
+        ModuleScorer(LCOM4(), cache).source('foo', source)
+
+        assert cache.get(cache.key('foo', source.encode('utf-8'))) == [
+            ('foo.Foo', 0)
+        ]
+
+    def test_score_content(self):
+        with open('tests/fixtures.py', 'rb') as handle:
+            content = handle.read()
+
+        result = ModuleScorer(LCOM4()).content('tests/fixtures.py', content)
+
+        assert result == ModuleScorer(LCOM4())('tests/fixtures.py')
+
+
+class FailingLCOM(LCOM4):
+    def __init__(self, name, delay=0):
+        self.failing = name
+        self.delay = delay
+
+    def calculate(self, ref):
+        if ref.name() == self.failing:
+            time.sleep(self.delay)
+            raise AttributeError('Broken %s' % ref.name())
+        return super(FailingLCOM, self).calculate(ref)
+
+
+class TestIsolatedModuleScorer(object):
+    SOURCE = 'class Foo(object):\n    pass\n\n\nclass Bar(object):\n    pass\n'
+
+    def test_skips_files_with_syntax_errors(self):
+        result = ModuleScorer(LCOM4(), isolate=True).source(
+            'foo', 'class Foo(object:\n', 'foo.py'
+        )
+
+        assert result == []
+        assert [name for name, _ in result.skipped] == ['foo.py']
+        assert result.skipped[0][1].startswith('SyntaxError: ')
+
+    def test_skips_missing_files(self, tmpdir):
+        file = str(tmpdir.join('missing.py'))
+
+        result = ModuleScorer(LCOM4(), isolate=True)(file)
+
+        assert result == []
+        assert [name for name, _ in result.skipped] == [file]
+
+    def test_skips_failing_classes(self):
+        result = ModuleScorer(FailingLCOM('foo.Foo'), isolate=True).source(
+            'foo', self.SOURCE
+        )
+
+        assert result == [('foo.Bar', 0)]
+        assert result.skipped == [
+            ('foo.Foo', 'AttributeError: Broken foo.Foo')
+        ]
+
+    def test_skips_files_over_time_budget(self):
+        if not hasattr(signal, 'setitimer'):
+            skip('Requires interval timers')
+
+        scorer = ModuleScorer(
+            FailingLCOM('foo.Foo', 1), isolate=True, timeout=0.01
+        )
+
+        result = scorer.source('foo', self.SOURCE, 'foo.py')
+
+        assert result == []
+        assert result.skipped == [
+            ('foo.py', 'ScoreTimeout: Timed out after 0.01s')
+        ]
+
+    def test_raises_when_not_isolated(self):
+        with raises(AttributeError):
+            ModuleScorer(FailingLCOM('foo.Foo')).source('foo', self.SOURCE)
+
+    def test_does_not_cache_skipped_results(self, tmpdir):
+        cache = ResultCache(str(tmpdir), 'LCOM4')
+        scorer = ModuleScorer(FailingLCOM('foo.Foo'), cache, isolate=True)
+
+        scorer.source('foo', self.SOURCE)
+
+        assert cache.get(cache.key('foo', self.SOURCE.encode('utf-8'))) \
+            is None
+
 
 class TestLCOMAlgorithmFactory(object):
     def test_create_lcom4(self):
@@ -84,6 +583,31 @@ class TestLCOMAlgorithmFactory(object):
 
         assert isinstance(result, LCOM4)
 
+    def test_create_lcom4_with_backend(self):
+        bitset = LCOMFactory.create(LCOMFactory.LCOM4, LCOMFactory.BITSET)
+        numpy = LCOMFactory.create(LCOMFactory.LCOM4, LCOMFactory.NUMPY)
+
+        assert isinstance(bitset, BitsetLCOM4)
+        assert isinstance(numpy, NumpyLCOM4)
+
+    def test_create_other_algorithms(self):
+        for name in ('LCOM1', 'LCOM2', 'LCOM3', 'LCOM5', 'TCC', 'LCC'):
+            assert LCOMFactory.create(name).name() == name
+
+    def test_create_suite(self):
+        result = LCOMFactory.create('LCOM4, LCOM5,TCC')
+
+        assert isinstance(result, LCOMSuite)
+        assert result.name() == 'LCOM4,LCOM5,TCC'
+
+    def test_create_unknown_algorithm(self):
+        with raises(Exception):
+            LCOMFactory.create('LCOM4,LCOM9')
+
+    def test_create_unknown_backend(self):
+        with raises(Exception):
+            LCOMFactory.create(LCOMFactory.LCOM4, 'foo')
+
 
 class TestSTDOutPrinter(object):
     def test_print(self):
@@ -116,12 +640,155 @@ class TestSTDOutPrinter(object):
         assert output == expected
 
 
+class TestSTDOutPrinterWithFraction(object):
+    def test_print(self, capsys):
+        STDOut().render('TCC', [('Foo', 2 / 3.0), ('Bar', 0.0)], 1 / 3.0)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[5] == '| Bar     | 0.00 |'
+        assert lines[6] == '| Foo     | 0.67 |'
+        assert lines[8] == '| Average | 0.33 |'
+
+
+class TestSTDOutPrinterWithSuite(object):
+    def test_print(self, capsys):
+        STDOut().render('LCOM4,TCC', [('Foo', (1, 0.5))], (1.0, 0.5))
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[1] == 'Calculating LCOM using LCOM4,TCC'
+        assert lines[3] == '| Method  | LCOM4 | TCC  |'
+        assert lines[5] == '| Foo     | 1     | 0.50 |'
+        assert lines[7] == '| Average | 1.00  | 0.50 |'
+
+
+class TestSTDOutRollup(object):
+    def test_print(self, capsys):
+        rollup = Rollup((1, 2))
+        rollup.add('foo.bar', 1)
+        rollup.add('foo.bar', 2)
+
+        STDOut().rollup(rollup)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[1] == (
+            '| Package | Classes | Average | Max | P50 | P90 | <1 | 1-2 | 2+ |'
+        )
+        assert lines[3] == (
+            '| foo     | 2       | 1.50    | 2   | 1   | 2   | 0  | 1   | 1  |'
+        )
+        assert lines[4] == (
+            '| foo.bar | 2       | 1.50    | 2   | 1   | 2   | 0  | 1   | 1  |'
+        )
+
+
+class TestJSONLinesPrinter(object):
+    def test_print(self):
+        stream = StringIO()
+
+        JSONLines(stream).render('lcom0', [('Foo', 1), ('Bar', 2)], 1.5)
+
+        result = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert result == [
+            {'type': 'class', 'algorithm': 'lcom0', 'name': 'Foo', 'score': 1},
+            {'type': 'class', 'algorithm': 'lcom0', 'name': 'Bar', 'score': 2},
+            {
+                'type': 'summary',
+                'algorithm': 'lcom0',
+                'classes': 2,
+                'average': 1.5
+            },
+        ]
+
+    def test_writes_rows_immediately(self):
+        stream = StringIO()
+        printer = JSONLines(stream)
+
+        printer.start('lcom0')
+        printer.row('Foo', 1)
+
+        assert json.loads(stream.getvalue())['name'] == 'Foo'
+
+    def test_print_suite_as_record_per_algorithm(self):
+        stream = StringIO()
+
+        JSONLines(stream).render('LCOM4,TCC', [('Foo', (1, 0.5))], (1, 0.5))
+
+        result = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [(elem['algorithm'], elem['type']) for elem in result] == [
+            ('LCOM4', 'class'),
+            ('TCC', 'class'),
+            ('LCOM4', 'summary'),
+            ('TCC', 'summary'),
+        ]
+
+
+class TestJSONLinesRollup(object):
+    def test_print(self):
+        stream = StringIO()
+        rollup = Rollup((1, 2))
+        rollup.add('foo', 1)
+        rollup.add('foo', 2)
+        printer = JSONLines(stream)
+
+        printer.start('LCOM4,TCC')
+        printer.rollup(rollup)
+
+        assert json.loads(stream.getvalue()) == {
+            'type': 'rollup',
+            'algorithm': 'LCOM4',
+            'name': 'foo',
+            'classes': 2,
+            'average': 1.5,
+            'max': 2,
+            'p50': 1,
+            'p90': 2,
+            'histogram': {'<1': 0, '1-2': 1, '2+': 1},
+        }
+
+
+class TestCSVPrinter(object):
+    def test_print(self):
+        stream = StringIO()
+
+        CSV(stream).render('lcom0', [('Foo', 1), ('Bar, Baz', 2)], 1.5)
+
+        assert stream.getvalue().splitlines() == [
+            'name,algorithm,score',
+            'Foo,lcom0,1',
+            '"Bar, Baz",lcom0,2',
+            'Average,lcom0,1.5',
+        ]
+
+    def test_print_suite_as_row_per_algorithm(self):
+        stream = StringIO()
+
+        CSV(stream).render('LCOM4,TCC', [('Foo', (1, 0.5))], (1.0, 0.5))
+
+        assert stream.getvalue().splitlines() == [
+            'name,algorithm,score',
+            'Foo,LCOM4,1',
+            'Foo,TCC,0.5',
+            'Average,LCOM4,1.0',
+            'Average,TCC,0.5',
+        ]
+
+
 class TestPrinterFactory(object):
     def test_create_std(self):
         result = PrinterFactory.create(PrinterFactory.STD)
 
         assert isinstance(result, STDOut)
 
+    def test_create_jsonl(self):
+        result = PrinterFactory.create(PrinterFactory.JSONL)
+
+        assert isinstance(result, JSONLines)
+
+    def test_create_csv(self):
+        result = PrinterFactory.create(PrinterFactory.CSV)
+
+        assert isinstance(result, CSV)
+
 
 class TestRunner(object):
     def setup_method(self):
@@ -146,3 +813,298 @@ class TestRunner(object):
             [('FakeReflection', 1)],
             1.0
         )]
+
+    def test_handle_in_parallel_matches_serial(self):
+        serial = FakePrinter()
+        parallel = FakePrinter()
+
+        Runner(FileSystem(), LCOM4(), serial).handle(['src', 'tests'])
+        Runner(FileSystem(), LCOM4(), parallel, 2).handle(['src', 'tests'])
+
+        assert parallel.output == serial.output
+        assert parallel.output[0][1]
+
+    def test_handle_with_cache_matches_uncached(self, tmpdir):
+        plain = FakePrinter()
+        cold = FakePrinter()
+        warm = FakePrinter()
+        cache = ResultCache(str(tmpdir), 'LCOM4')
+
+        Runner(FileSystem(), LCOM4(), plain).handle(['src'])
+        Runner(FileSystem(), LCOM4(), cold, cache=cache).handle(['src'])
+        Runner(FileSystem(), LCOM4(), warm, cache=cache).handle(['src'])
+
+        assert cold.output == plain.output
+        assert warm.output == plain.output
+
+    def test_handle_with_reader_matches_serial(self):
+        serial = FakePrinter()
+        threaded = FakePrinter()
+
+        Runner(FileSystem(), LCOM4(), serial).handle(['src', 'tests'])
+        Runner(
+            FileSystem(), LCOM4(), threaded, reader=BulkReader(4)
+        ).handle(['src', 'tests'])
+
+        assert threaded.output == serial.output
+        assert threaded.output[0][1]
+
+    def test_handle_reports_violations_to_gate(self):
+        self.fs.result = [FakeReflection()]
+        self.lcom.result = 3
+        gate = Gate(max_score=2, max_average=2)
+
+        Runner(self.fs, self.lcom, self.printer).handle(['/foo'], gate=gate)
+
+        assert gate.violations() == [
+            'FakeReflection: 3 exceeds 2',
+            'Average: 3.00 exceeds 2',
+        ]
+
+    def test_handle_fail_fast_stops_scoring(self):
+        parsed = []
+
+        class CountingFileSystem(FakeFileSystem):
+            def find(self, path, filename=None):
+                for _ in range(5):
+                    parsed.append(path)
+                    yield FakeReflection()
+
+        self.lcom.result = 3
+        gate = Gate(max_score=2, fail_fast=True)
+
+        Runner(CountingFileSystem(), self.lcom, self.printer).handle(
+            ['/foo'], gate=gate
+        )
+
+        assert parsed == ['/foo']
+        assert self.printer.output == [
+            ('FakeLCOM', [('FakeReflection', 3)], 3.0)
+        ]
+        assert gate.violations() == ['FakeReflection: 3 exceeds 2']
+
+    def test_handle_in_parallel_fail_fast_stops_scoring(self):
+        full = FakePrinter()
+        gate = Gate(max_score=0, fail_fast=True)
+
+        Runner(FileSystem(), LCOM4(), full, 2).handle(['src', 'tests'])
+        Runner(FileSystem(), LCOM4(), self.printer, 2).handle(
+            ['src', 'tests'], gate=gate
+        )
+
+        assert gate.stopped()
+        assert len(self.printer.output[0][1]) < len(full.output[0][1])
+
+    def test_diff_reports_only_changed_classes(self, tmpdir, monkeypatch):
+        monkeypatch.chdir(tmpdir)
+        tmpdir.join('foo.py').write('class Foo(object):\n    pass\n')
+        tmpdir.join('bar.py').write('class Bar(object):\n    pass\n')
+        runner = Runner(FileSystem(), LCOM4(), FakePrinter())
+        files, changes, errors = runner.diff([os.curdir])
+
+        tmpdir.join('bar.py').write(
+            'class Bar(object):\n    def a(self):\n        return self.x\n'
+        )
+        files, changes, errors = Runner(
+            FileSystem(), LCOM4(), self.printer
+        ).diff([os.curdir], files)
+
+        assert [tuple(elem) for elem in changes] == [('bar.Bar', 0, 1)]
+        assert self.printer.output == [('LCOM4', [('bar.Bar', 1)], 0.5)]
+
+    def test_diff_skips_files_with_unchanged_content(self, tmpdir,
+                                                     monkeypatch):
+        monkeypatch.chdir(tmpdir)
+        tmpdir.join('foo.py').write('class Foo(object):\n    pass\n')
+        files, _, _ = Runner(FileSystem(), LCOM4(), FakePrinter()).diff(
+            [os.curdir]
+        )
+        files = [
+            (file, elem._replace(scores=[('foo.Foo', 7)]))
+            for file, elem in files
+        ]
+
+        files, changes, errors = Runner(
+            FileSystem(), LCOM4(), self.printer
+        ).diff([os.curdir], files)
+
+        assert changes == []
+        assert files[0][1].scores == [('foo.Foo', 7)]
+        assert self.printer.output == [('LCOM4', [], 7.0)]
+
+    def test_diff_reports_removed_classes(self, tmpdir, monkeypatch):
+        monkeypatch.chdir(tmpdir)
+        tmpdir.join('foo.py').write('class Foo(object):\n    pass\n')
+        files, _, _ = Runner(FileSystem(), LCOM4(), FakePrinter()).diff(
+            [os.curdir]
+        )
+        tmpdir.join('foo.py').remove()
+
+        files, changes, errors = Runner(
+            FileSystem(), LCOM4(), self.printer
+        ).diff([os.curdir], files)
+
+        assert files == []
+        assert [tuple(elem) for elem in changes] == [('foo.Foo', 0, None)]
+
+    def test_watch_renders_and_rescores_changed_files(self, tmpdir,
+                                                      monkeypatch):
+        monkeypatch.chdir(tmpdir)
+        file = tmpdir.join('foo.py')
+        file.write('class Foo(object):\n'
+                   '    def a(self):\n        return self.x\n'
+                   '    def b(self):\n        return self.y\n')
+        runner = Runner(FileSystem(), LCOM4(), self.printer)
+
+        watch = runner.watch([os.curdir], 0.01)
+        changes, errors = next(watch)
+
+        assert [elem.name for elem in changes] == ['foo.Foo']
+        assert self.printer.output == [('LCOM4', [('foo.Foo', 2)], 2.0)]
+
+        file.write('class Foo(object):\n'
+                   '    def a(self):\n        return self.x\n\n\n'
+                   'class Bar(object):\n'
+                   '    def a(self):\n        return self.x\n')
+        changes, errors = next(watch)
+
+        assert [elem.name for elem in changes] == ['foo.Foo', 'foo.Bar']
+        assert self.printer.output[-1] == (
+            'LCOM4', [('foo.Foo', 1), ('foo.Bar', 1)], 1.0
+        )
+
+    def test_handle_sources(self):
+        Runner(FakeFileSystem(), LCOM4(), self.printer).handle_sources([
+            ('foo', 'class Foo(object):\n    def a(self):\n        self.x\n'),
+            ('bar', b'class Bar(object):\n    pass\n'),
+        ])
+
+        assert self.printer.output == [
+            ('LCOM4', [('foo.Foo', 1), ('bar.Bar', 0)], 0.5)
+        ]
+
+    def test_handle_sources_with_rollup(self):
+        rollup = Rollup()
+        Runner(FakeFileSystem(), LCOM4(), self.printer).handle_sources([
+            ('foo.bar', 'class Foo(object):\n'
+                        '    class Bar(object):\n'
+                        '        def a(self):\n'
+                        '            return self.x\n'),
+            ('foo', b'class Baz(object):\n    pass\n'),
+        ], rollup=rollup)
+
+        assert [
+            (name, node.count()) for name, node in rollup.nodes()
+        ] == [('foo', 3), ('foo.bar', 2)]
+
+    def test_handle_with_rollup_includes_context(self, tmpdir):
+        cache = ResultCache(str(tmpdir), 'LCOM4')
+        Runner(FileSystem(), LCOM4(), FakePrinter(), cache=cache).handle(
+            ['src/vcs.py', 'src/ignore.py']
+        )
+        rollup = Rollup()
+
+        Runner(FileSystem(), LCOM4(), self.printer, cache=cache).handle(
+            ['src/vcs.py'], context=['src'], rollup=rollup
+        )
+
+        assert [name for name, node in rollup.nodes()] == [
+            'src', 'src.ignore', 'src.vcs'
+        ]
+
+    def test_handle_sources_in_parallel_matches_serial(self):
+        sources = []
+        for file in ('src/lcom.py', 'src/command.py', 'tests/fixtures.py'):
+            with open(file, 'rb') as handle:
+                sources.append((file[:-3].replace('/', '.'), handle.read()))
+        parallel = FakePrinter()
+
+        Runner(FakeFileSystem(), LCOM4(), self.printer).handle_sources(
+            iter(sources)
+        )
+        Runner(FakeFileSystem(), LCOM4(), parallel, 2).handle_sources(
+            iter(sources)
+        )
+
+        assert parallel.output == self.printer.output
+        assert ('tests.fixtures.Three', 3) in parallel.output[0][1]
+
+    def test_handle_reports_skipped_files(self, tmpdir):
+        tmpdir.join('good.py').write('class Good(object):\n    pass\n')
+        tmpdir.join('bad.py').write('class Bad(object:\n')
+
+        for jobs in (1, 2):
+            printer = FakePrinter()
+            runner = Runner(FileSystem(), LCOM4(), printer, jobs, isolate=True)
+            runner.handle([str(tmpdir)])
+
+            assert [name for name, _ in printer.output[0][1]] == [
+                '%s.good.Good' % ModuleReflection.module_name(str(tmpdir))
+            ]
+            assert [name for name, _ in runner.skipped()] == [
+                str(tmpdir.join('bad.py'))
+            ]
+
+    def test_handle_with_reader_reports_unreadable_files(self):
+        def opener(path, mode):
+            raise IOError('Permission denied')
+
+        runner = Runner(
+            FileSystem(), LCOM4(), self.printer,
+            reader=BulkReader(2, opener=opener, tolerant=True),
+            isolate=True
+        )
+        runner.handle(['src/vcs.py'])
+
+        assert self.printer.output == [('LCOM4', [], 0)]
+        assert [name for name, _ in runner.skipped()] == ['src/vcs.py']
+        assert runner.skipped()[0][1].endswith('Permission denied')
+
+    def test_handle_streams_rows_as_they_are_scored(self):
+        events = []
+
+        class StreamingFileSystem(FakeFileSystem):
+            def find(self, path, filename=None):
+                for _ in range(2):
+                    events.append('parsed')
+                    yield FakeReflection()
+
+        class StreamingPrinter(FakePrinter):
+            def row(self, name, score):
+                events.append('row')
+                super(StreamingPrinter, self).row(name, score)
+
+        runner = Runner(StreamingFileSystem(), self.lcom, StreamingPrinter())
+        runner.handle(['/foo'])
+
+        assert events == ['parsed', 'row', 'parsed', 'row']
+
+    def test_handle_includes_cached_context_in_average(self, tmpdir):
+        cache = ResultCache(str(tmpdir), 'LCOM4')
+        scorer = ModuleScorer(LCOM4(), cache)
+        fixtures = scorer('tests/fixtures.py')
+        scorer('src/lcom.py')
+
+        Runner(FileSystem(), LCOM4(), self.printer, cache=cache).handle(
+            ['tests/fixtures.py'],
+            context=['tests/fixtures.py', 'src/lcom.py', 'src/command.py']
+        )
+
+        lcom = scorer.cached('src/lcom.py')
+        scores = [score for _, score in fixtures + lcom]
+        algorithm, classes, average = self.printer.output[0]
+        assert classes == fixtures
+        assert average == float(sum(scores)) / len(scores)
+
+    def test_handle_with_profiler(self):
+        profiler = Profiler()
+
+        Runner(FileSystem(), LCOM4(), self.printer, 2, profiler=profiler) \
+            .handle(['tests/fixtures.py'])
+
+        algorithm, classes, average = self.printer.output[0]
+        assert ('tests.fixtures.Three', 3) in classes
+        assert set(profiler.stages()) == set(Profiler.STAGES)
+        assert list(profiler.files()) == ['tests/fixtures.py']
+        assert profiler.files()['tests/fixtures.py'][1] == len(classes)
+        assert set(profiler.classes()) == {name for name, _ in classes}
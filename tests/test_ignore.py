@@ -0,0 +1,69 @@
+import os
+
+from src.ignore import GitIgnore
+
+
+class TestGitIgnore(object):
+    def ignore(self, *lines):
+        return GitIgnore(GitIgnore.parse(os.path.abspath('root'), lines))
+
+    def path(self, path):
+        return os.path.join('root', *path.split('/'))
+
+    def test_parse_skips_comments_and_blank_lines(self):
+        result = GitIgnore.parse('root', ['# comment', '', '   ', '*.pyc'])
+
+        assert [rule.pattern for rule in result] == ['*.pyc']
+
+    def test_matches_name_at_any_depth(self):
+        ignore = self.ignore('*.pyc')
+
+        assert ignore.ignores(self.path('a.pyc'))
+        assert ignore.ignores(self.path('a/b/c.pyc'))
+        assert not ignore.ignores(self.path('a/b/c.py'))
+
+    def test_matches_anchored_pattern(self):
+        ignore = self.ignore('/build', 'docs/api')
+
+        assert ignore.ignores(self.path('build'), True)
+        assert not ignore.ignores(self.path('pkg/build'), True)
+        assert ignore.ignores(self.path('docs/api'), True)
+        assert not ignore.ignores(self.path('pkg/docs/api'), True)
+
+    def test_matches_directory_only_pattern(self):
+        ignore = self.ignore('dist/')
+
+        assert ignore.ignores(self.path('pkg/dist'), True)
+        assert not ignore.ignores(self.path('pkg/dist'), False)
+
+    def test_negation_reincludes(self):
+        ignore = self.ignore('*.py', '!keep.py')
+
+        assert ignore.ignores(self.path('drop.py'))
+        assert not ignore.ignores(self.path('keep.py'))
+
+    def test_leading_double_star(self):
+        ignore = self.ignore('**/generated')
+
+        assert ignore.ignores(self.path('a/b/generated'), True)
+
+    def test_descend_without_file_keeps_rules(self, tmpdir):
+        ignore = self.ignore('*.pyc')
+
+        assert ignore.descend(str(tmpdir)) is ignore
+
+    def test_descend_reads_gitignore(self, tmpdir):
+        tmpdir.join('.gitignore').write('*.pyc\n')
+
+        ignore = GitIgnore().descend(str(tmpdir))
+
+        assert ignore.ignores(str(tmpdir.join('a.pyc')))
+        assert not ignore.ignores(str(tmpdir.join('a.py')))
+
+    def test_for_directory_outside_repository(self, tmpdir):
+        tmpdir.join('.gitignore').write('*.py\n')
+        tmpdir.join('pkg').mkdir()
+
+        ignore = GitIgnore.for_directory(str(tmpdir.join('pkg')))
+
+        assert not ignore.ignores(str(tmpdir.join('pkg', 'a.py')))
@@ -0,0 +1,64 @@
+import pickle
+import threading
+import time
+
+from pytest import mark, raises
+
+from src.isolation import ModuleScores, ScoreTimeout, TimeBudget
+
+signals = mark.skipif(
+    not hasattr(__import__('signal'), 'setitimer'),
+    reason='Requires interval timers'
+)
+
+
+class TestModuleScores(object):
+    def test_is_a_list_of_scores(self):
+        result = ModuleScores([('foo.Bar', 1)], [('foo.Baz', 'Error')])
+
+        assert result == [('foo.Bar', 1)]
+        assert result.skipped == [('foo.Baz', 'Error')]
+
+    def test_survives_pickling(self):
+        result = pickle.loads(pickle.dumps(
+            ModuleScores([('foo.Bar', 1)], [('foo.Baz', 'Error')], 'foo'), 2
+        ))
+
+        assert result == [('foo.Bar', 1)]
+        assert result.skipped == [('foo.Baz', 'Error')]
+        assert result.module == 'foo'
+
+
+class TestTimeBudget(object):
+    @signals
+    def test_interrupts_slow_code(self):
+        with raises(ScoreTimeout) as e:
+            with TimeBudget(0.01):
+                time.sleep(1)
+
+        assert str(e.value) == 'Timed out after 0.01s'
+
+    @signals
+    def test_cancels_timer_on_exit(self):
+        with TimeBudget(0.01):
+            pass
+
+        time.sleep(0.02)
+
+    def test_without_budget(self):
+        with TimeBudget():
+            time.sleep(0.01)
+
+    def test_is_disabled_outside_main_thread(self):
+        result = []
+
+        def run():
+            with TimeBudget(0.01):
+                time.sleep(0.02)
+            result.append(True)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+
+        assert result == [True]
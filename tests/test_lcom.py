@@ -1,4 +1,11 @@
-from src.lcom import LCOM4
+import os
+import sys
+
+from pytest import importorskip, mark
+
+from src.lcom import LCOM4, DisjointSet, CallClosure, BitsetLCOM4, \
+    NumpyLCOM4, ClassGraph, LCOMSuite, LCOM1, LCOM2, LCOM3, LCOM5, TCC, LCC, \
+    MethodNode
 from src.reflection import ModuleReflection
 
 
@@ -8,6 +15,87 @@ class LCOMTestCase(object):
         cls.fixtures = ModuleReflection.from_file('./tests/fixtures.py')
 
 
+class TestDisjointSet(object):
+    def setup_method(self):
+        self.components = DisjointSet()
+
+    def test_empty(self):
+        assert len(self.components) == 0
+        assert self.components.groups() == []
+
+    def test_add_creates_singleton(self):
+        self.components.add('a')
+        self.components.add('a')
+
+        assert len(self.components) == 1
+        assert 'a' in self.components
+        assert self.components.find('a') == 'a'
+
+    def test_union_merges_components(self):
+        self.components.union('a', 'b')
+        self.components.union('c', 'd')
+
+        assert len(self.components) == 2
+        assert self.components.find('a') == self.components.find('b')
+        assert self.components.find('a') != self.components.find('c')
+
+    def test_union_all_bridges_components(self):
+        self.components.union_all(['a', 'b'])
+        self.components.union_all(['c', 'd'])
+        self.components.union_all(['b', 'c'])
+
+        assert len(self.components) == 1
+        assert self.components.groups() == [{'a', 'b', 'c', 'd'}]
+
+
+class TestCallClosure(object):
+    def test_reach_of_unknown_method_is_empty(self):
+        closure = CallClosure({}, {})
+
+        assert closure.reach('a') == frozenset()
+
+    def test_reach_follows_chain(self):
+        closure = CallClosure(
+            {'a': ['b'], 'b': ['c'], 'c': []},
+            {'a': {'b'}, 'b': {'c', 'x'}, 'c': {'y'}}
+        )
+
+        assert closure.reach('a') == {'b', 'c', 'x', 'y'}
+        assert closure.reach('b') == {'c', 'x', 'y'}
+        assert closure.reach('c') == {'y'}
+
+    def test_reach_handles_mutual_recursion(self):
+        closure = CallClosure(
+            {'a': ['b'], 'b': ['a', 'c'], 'c': []},
+            {'a': {'b'}, 'b': {'a', 'c'}, 'c': {'x'}}
+        )
+
+        assert closure.reach('a') == {'a', 'b', 'c', 'x'}
+        assert closure.reach('a') is closure.reach('b')
+
+    def test_reach_of_bitmasks(self):
+        closure = CallClosure(
+            {'a': ['b'], 'b': ['a', 'c'], 'c': []},
+            {'a': 0b001, 'b': 0b010, 'c': 0b100},
+            int
+        )
+
+        assert closure.reach('a') == 0b111
+        assert closure.reach('c') == 0b100
+        assert closure.reach('d') == 0
+
+    def test_reach_handles_deep_chain(self):
+        depth = 5000
+        calls = {i: [i + 1] for i in range(depth)}
+        calls[depth] = []
+        direct = {i: {i + 1} for i in range(depth)}
+        direct[depth] = {'x'}
+
+        closure = CallClosure(calls, direct)
+
+        assert len(closure.reach(0)) == depth + 1
+
+
 class TestLCOM4(LCOMTestCase):
     def test_calculate_for_zero(self):
         ref = self.fixtures.class_by_name('tests.fixtures.Zero')
@@ -44,3 +132,164 @@ class TestLCOM4(LCOMTestCase):
         lcom = LCOM4().calculate(ref)
 
         assert lcom == 0
+
+    def test_calculate_for_bridged(self):
+        ref = self.fixtures.class_by_name('tests.fixtures.Bridged')
+        lcom = LCOM4().calculate(ref)
+
+        assert lcom == 1
+
+    def test_calculate_for_recursive(self):
+        ref = self.fixtures.class_by_name('tests.fixtures.Recursive')
+        lcom = LCOM4().calculate(ref)
+
+        assert lcom == 2
+
+    def test_calculate_for_long_call_chain(self):
+        lines = ['class Chain:']
+        for i in range(1000):
+            lines += [
+                '    def method_%d(self):' % i,
+                '        return self.method_%d()' % (i + 1),
+            ]
+        lines += [
+            '    def method_1000(self):',
+            '        return self.x',
+        ]
+        module = ModuleReflection.from_string('chain', os.linesep.join(lines))
+
+        lcom = LCOM4().calculate(module.class_by_name('chain.Chain'))
+
+        assert lcom == 1
+
+
+FIXTURES = (
+    'Zero', 'One', 'DeepOne', 'Two', 'Three', 'Loose', 'Reflection',
+    'Bridged', 'Recursive',
+)
+
+
+class TestBitsetLCOM4(LCOMTestCase):
+    @mark.parametrize('name', FIXTURES)
+    def test_matches_lcom4(self, name):
+        ref = self.fixtures.class_by_name('tests.fixtures.%s' % name)
+
+        assert BitsetLCOM4().calculate(ref) == LCOM4().calculate(ref)
+
+    def test_components_merges_bridged_paths(self):
+        paths = [0b0011, 0b1100, 0b0110, 0b10000]
+
+        assert BitsetLCOM4().components(paths, 5) == 2
+
+
+class TestNumpyLCOM4(LCOMTestCase):
+    @mark.parametrize('name', FIXTURES)
+    def test_matches_lcom4(self, name):
+        importorskip('numpy')
+        ref = self.fixtures.class_by_name('tests.fixtures.%s' % name)
+
+        assert NumpyLCOM4().calculate(ref) == LCOM4().calculate(ref)
+
+    def test_measure_without_methods(self):
+        importorskip('numpy')
+
+        assert NumpyLCOM4().measure(ClassGraph(())) == 0
+
+    def test_measure_merges_long_chain(self):
+        importorskip('numpy')
+        graph = ClassGraph(tuple(
+            MethodNode(i, frozenset(['x%d' % i, 'x%d' % (i + 1)]), (),
+                       False, True)
+            for i in range(1000)
+        ))
+
+        assert NumpyLCOM4().measure(graph) == 1
+
+    def test_falls_back_without_numpy(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+        ref = self.fixtures.class_by_name('tests.fixtures.Two')
+
+        assert NumpyLCOM4().calculate(ref) == 2
+
+
+class TestClassGraph(LCOMTestCase):
+    def setup_method(self):
+        ref = self.fixtures.class_by_name('tests.fixtures.One')
+        self.graph = ClassGraph.from_reflection(ref)
+
+    def method(self, name):
+        for method in self.graph.methods():
+            if method.name == 'tests.fixtures.One::%s' % name:
+                return method
+
+    def test_members_skip_constructor(self):
+        result = {method.name for method in self.graph.members()}
+
+        assert 'tests.fixtures.One::__init__' not in result
+        assert len(result) == 5
+
+    def test_related_skip_loose_methods(self):
+        result = {method.name for method in self.graph.related()}
+
+        assert 'tests.fixtures.One::e' not in result
+
+    def test_usage_follows_calls(self):
+        assert self.graph.usage(self.method('a')) == {'x'}
+        assert self.graph.usage(self.method('c')) == {'x', 'y'}
+
+    def test_edges_follow_calls_from_related_methods(self):
+        graph = ClassGraph((
+            MethodNode('__init__', frozenset(['x', 'y']), (), True, False),
+            MethodNode('a', frozenset(['x']), ('helper',), False, True),
+            MethodNode('helper', frozenset(['z']), (), False, False),
+            MethodNode('b', frozenset(['y']), (), False, True),
+        ))
+
+        assert sorted(graph.edges()) == [
+            ('a', 'a'), ('a', 'helper'), ('a', 'x'),
+            ('b', 'b'), ('b', 'y'),
+            ('helper', 'helper'), ('helper', 'z'),
+        ]
+        assert LCOM4().measure(graph) == 2
+
+
+class TestLCOMSuite(LCOMTestCase):
+    def test_name(self):
+        assert LCOMSuite([LCOM4(), TCC()]).name() == 'LCOM4,TCC'
+
+    def test_extracts_graph_once(self):
+        graphs = []
+
+        class Spy(LCOM4):
+            def measure(self, graph):
+                graphs.append(graph)
+                return super(Spy, self).measure(graph)
+
+        ref = self.fixtures.class_by_name('tests.fixtures.Two')
+        result = LCOMSuite([Spy(), Spy()]).calculate(ref)
+
+        assert result == (2, 2)
+        assert graphs[0] is graphs[1]
+
+
+METRICS = (
+    ('Zero', (0, 0, 0, 0.0, 0.0, 0.0)),
+    ('One', (8, 6, 3, 0.75, 0.4, 0.6)),
+    ('DeepOne', (10, 10, 5, 1.0, 1.0, 1.0)),
+    ('Two', (9, 8, 4, 0.875, 0.2, 0.2)),
+    ('Three', (3, 3, 3, 1.0, 0.0, 0.0)),
+    ('Bridged', (3, 0, 1, 2 / 3.0, 0.5, 1.0)),
+)
+
+
+class TestCohesionMetrics(LCOMTestCase):
+    @mark.parametrize('name,expected', METRICS)
+    def test_calculate(self, name, expected):
+        ref = self.fixtures.class_by_name('tests.fixtures.%s' % name)
+        suite = LCOMSuite([LCOM1(), LCOM2(), LCOM3(), LCOM5(), TCC(), LCC()])
+
+        result = suite.calculate(ref)
+
+        assert result[:3] == expected[:3]
+        assert [round(elem, 6) for elem in result[3:]] == \
+            [round(elem, 6) for elem in expected[3:]]
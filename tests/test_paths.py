@@ -0,0 +1,26 @@
+import os
+
+from src.paths import Paths
+
+
+class TestPaths(object):
+    def test_within_directory(self):
+        assert Paths.within(os.path.join('src', 'vcs.py'), ['src'])
+        assert Paths.within(os.path.join('src', 'vcs.py'), ['src/'])
+
+    def test_within_file_itself(self):
+        assert Paths.within(os.path.join('src', 'vcs.py'), ['src/vcs.py'])
+
+    def test_within_current_directory(self):
+        assert Paths.within(os.path.join('src', 'vcs.py'), [os.curdir])
+
+    def test_within_absolute_path(self):
+        assert Paths.within(
+            os.path.join('src', 'vcs.py'), [os.path.abspath('src')]
+        )
+
+    def test_not_within_sibling_with_common_prefix(self):
+        assert not Paths.within(os.path.join('srcs', 'vcs.py'), ['src'])
+
+    def test_not_within_nothing(self):
+        assert not Paths.within(os.path.join('src', 'vcs.py'), [])
@@ -0,0 +1,81 @@
+import ast
+
+from src.profiler import NullProfiler, Profiler
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+
+class TestNullProfiler(object):
+    def setup_method(self):
+        self.profiler = NullProfiler()
+
+    def test_is_disabled(self):
+        assert self.profiler.enabled() is False
+
+    def test_stage_is_shared_noop(self):
+        with self.profiler.stage('parse', 'foo.py') as stage:
+            pass
+
+        assert stage is self.profiler.stage('score')
+
+    def test_iterate_returns_iterable(self):
+        iterable = [1, 2]
+
+        assert self.profiler.iterate('discover', iterable) is iterable
+
+
+class TestProfiler(object):
+    def setup_method(self):
+        self.profiler = Profiler(top=1)
+
+    def test_records_stages_per_file_and_class(self):
+        with self.profiler.stage('parse', 'foo.py'):
+            pass
+        with self.profiler.stage('score', 'foo.py', 'foo.Bar'):
+            pass
+
+        assert set(self.profiler.stages()) == {'parse', 'score'}
+        assert list(self.profiler.files()) == ['foo.py']
+        assert list(self.profiler.classes()) == ['foo.Bar']
+
+    def test_stage_records_time_on_error(self):
+        try:
+            with self.profiler.stage('parse', 'foo.py'):
+                raise ValueError()
+        except ValueError:
+            pass
+
+        assert 'parse' in self.profiler.stages()
+
+    def test_iterate_times_each_step(self):
+        result = list(self.profiler.iterate('discover', iter([1, 2])))
+
+        assert result == [1, 2]
+        assert 'discover' in self.profiler.stages()
+
+    def test_counts_nodes_and_classes(self):
+        node = ast.parse('class Foo:\n    class Bar:\n        pass\n')
+
+        self.profiler.nodes('foo.py', node)
+
+        wall, classes, nodes = self.profiler.files()['foo.py']
+        assert classes == 2
+        assert nodes == len(list(ast.walk(node)))
+
+    def test_report(self):
+        for file in ('foo.py', 'bar.py'):
+            with self.profiler.stage('parse', file):
+                pass
+            with self.profiler.stage('score', file, '%s.Baz' % file):
+                pass
+        stream = StringIO()
+
+        self.profiler.report(stream)
+
+        output = stream.getvalue()
+        assert 'Profile' in output
+        assert 'Files: 2, classes: 0' in output
+        assert len(output.split('Slowest classes')[1].splitlines()) == 2
@@ -0,0 +1,114 @@
+import io
+import os
+import threading
+import time
+
+from pytest import raises
+
+from src.reader import BulkReader, JSONLinesReader, SourceError
+
+
+class FakeOpener(object):
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.opened = []
+        self.lock = threading.Lock()
+
+    def __call__(self, path, mode):
+        with self.lock:
+            self.opened.append(path)
+        time.sleep(self.delays.get(path, 0))
+        return io.BytesIO(path.encode('utf-8'))
+
+
+class TestBulkReader(object):
+    def test_read_preserves_order(self):
+        opener = FakeOpener({'a.py': 0.05, 'b.py': 0.01})
+        reader = BulkReader(4, opener=opener)
+
+        result = list(reader.read(['a.py', 'b.py', 'c.py']))
+
+        assert result == [
+            ('a.py', b'a.py'),
+            ('b.py', b'b.py'),
+            ('c.py', b'c.py'),
+        ]
+
+    def test_read_normalizes_path(self):
+        opener = FakeOpener()
+
+        list(BulkReader(2, opener=opener).read(['foo/bar.py']))
+
+        assert opener.opened == [os.path.join('foo', 'bar.py')]
+
+    def test_read_is_bounded_by_window(self):
+        opener = FakeOpener()
+        files = ['%d.py' % i for i in range(10)]
+        reader = BulkReader(2, window=3, opener=opener)
+
+        result = reader.read(iter(files))
+        next(result)
+
+        assert len(opener.opened) <= 3
+        assert [file for file, _ in result] == files[1:]
+
+    def test_read_reads_files_concurrently(self):
+        files = ['%d.py' % i for i in range(8)]
+        opener = FakeOpener(dict((file, 0.05) for file in files))
+
+        start = time.time()
+        list(BulkReader(8, opener=opener).read(files))
+
+        assert time.time() - start < 0.05 * len(files)
+
+    def test_read_propagates_errors(self):
+        def opener(path, mode):
+            raise IOError('No such file')
+
+        result = BulkReader(2, opener=opener).read(['foo.py'])
+
+        with raises(IOError) as e:
+            next(result)
+        assert str(e.value) == 'No such file'
+
+    def test_read_returns_errors_when_tolerant(self):
+        error = IOError('No such file')
+
+        def opener(path, mode):
+            raise error
+
+        result = BulkReader(2, opener=opener, tolerant=True).read(['foo.py'])
+
+        assert list(result) == [('foo.py', error)]
+
+
+class TestJSONLinesReader(object):
+    def read(self, *lines):
+        return list(JSONLinesReader().read(io.StringIO(u'\n'.join(lines))))
+
+    def test_read_named_sources(self):
+        result = self.read(
+            u'{"name": "foo.bar", "source": "class Bar: pass"}',
+            u'',
+            u'{"file": "foo/baz.py", "source": "class Baz: pass"}',
+        )
+
+        assert result == [
+            ('foo.bar', 'class Bar: pass'),
+            ('foo.baz', 'class Baz: pass'),
+        ]
+
+    def test_read_rejects_invalid_json(self):
+        with raises(SourceError) as e:
+            self.read(u'{"name": "foo", "source": ""}', u'{')
+        assert str(e.value).startswith('Invalid JSON on line 2')
+
+    def test_read_rejects_missing_source(self):
+        with raises(SourceError) as e:
+            self.read(u'{"name": "foo"}')
+        assert str(e.value) == 'Missing source on line 1'
+
+    def test_read_rejects_missing_name(self):
+        with raises(SourceError) as e:
+            self.read(u'{"source": ""}')
+        assert str(e.value) == 'Missing name on line 1'
@@ -1,6 +1,11 @@
 from pytest import raises
 
-from src.reflection import ModuleReflection, ReflectionError
+import ast
+import gc
+import weakref
+
+from src.reflection import ModuleReflection, ReflectionError, ClassIndexer, \
+    ClassReflection
 
 
 class ReflectionTestCase(object):
@@ -28,13 +33,166 @@ class TestModuleReflection(ReflectionTestCase):
             'tests.fixtures.Three',
             'tests.fixtures.Loose',
             'tests.fixtures.Reflection',
+            'tests.fixtures.Bridged',
+            'tests.fixtures.Recursive',
         }
 
+    def test_lists_nested_classes_with_qualified_names(self):
+        module = ModuleReflection.from_string('foo', '\n'.join([
+            'class Outer:',
+            '    class Inner:',
+            '        pass',
+            '    def a(self):',
+            '        class Local:',
+            '            pass',
+            'def factory():',
+            '    class Inner:',
+            '        pass',
+            'class Inner:',
+            '    pass',
+        ]))
+
+        assert [cls.name() for cls in module.classes()] == [
+            'foo.Outer',
+            'foo.Outer.Inner',
+            'foo.Outer.a.Local',
+            'foo.factory.Inner',
+            'foo.Inner',
+        ]
+
+    def test_class_by_qualified_name(self):
+        module = ModuleReflection.from_string('foo', '\n'.join([
+            'class Outer:',
+            '    class Inner:',
+            '        def a(self):',
+            '            return self.x',
+        ]))
+
+        ref = module.class_by_name('foo.Outer.Inner')
+
+        assert [method.name() for method in ref.methods()] == [
+            'foo.Outer.Inner::a'
+        ]
+        assert module.class_by_name('foo.Outer.Inner') is ref
+
+    def test_unknown_class_by_name(self):
+        with raises(ReflectionError) as e:
+            self.module.class_by_name('tests.fixtures.Unknown')
+
+        assert str(e.value) == 'Unknown class tests.fixtures.Unknown'
+
+    def test_releases_syntax_tree(self):
+        node = ast.parse('class Foo:\n    def a(self):\n        self.x\n')
+        ref = weakref.ref(node.body[0])
+
+        module = ModuleReflection('foo', node)
+        del node
+        gc.collect()
+
+        assert ref() is None
+        assert module.class_by_name('foo.Foo').vars() == ['x']
+
+
+class TestClassIndexer(object):
+    def index(self, source):
+        return ClassIndexer().index(ast.parse(source).body[0])
+
+    def test_indexes_methods_in_source_order(self):
+        index = self.index('\n'.join([
+            'class Foo:',
+            '    def b(self):',
+            '        return self.x',
+            '    def a(self):',
+            '        return self.b() + self.y',
+        ]))
+
+        assert [method.name for method in index.methods] == ['b', 'a']
+        assert index.methods[0].vars == {'x'}
+        assert index.methods[1].vars == {'y'}
+        assert index.methods[1].calls == {'b'}
+        assert index.vars == {'x', 'y'}
+
+    def test_indexes_decorator_names(self):
+        index = self.index('\n'.join([
+            'class Foo:',
+            '    @classmethod',
+            '    @functools.wraps(bar)',
+            '    @decorators.cached',
+            '    def a(cls):',
+            '        return cls.x',
+        ]))
+
+        assert index.methods[0].decorators == (
+            'classmethod',
+            'functools.wraps',
+            'decorators.cached',
+        )
+
+    def test_ignores_attributes_of_non_names(self):
+        index = self.index('\n'.join([
+            'class Foo:',
+            '    def a(self):',
+            '        return self.x.y + foo().z + self.b().c',
+        ]))
+
+        assert index.methods[0].vars == {'x'}
+        assert index.methods[0].calls == {'b'}
+        assert index.vars == {'x', 'b'}
+
+    def test_ignores_nested_class_bodies(self):
+        index = self.index('\n'.join([
+            'class Foo:',
+            '    class Bar:',
+            '        def a(self):',
+            '            return self.y',
+            '    def a(self):',
+            '        class Baz:',
+            '            def b(self):',
+            '                return self.z',
+            '        return self.x',
+        ]))
+
+        assert index.methods[0].vars == {'x'}
+        assert index.vars == {'x'}
+
+    def test_ignores_nested_functions_rebinding_self(self):
+        index = self.index('\n'.join([
+            'class Foo:',
+            '    def a(self):',
+            '        def helper(self):',
+            '            return self.y',
+            '        other = lambda self: self.z()',
+            '        return [self.x for _ in helper(other)]',
+        ]))
+
+        assert index.methods[0].vars == {'x'}
+        assert index.methods[0].calls == set()
+        assert index.vars == {'x'}
+
+    def test_indexes_closures_over_self(self):
+        index = self.index('\n'.join([
+            'class Foo:',
+            '    def a(self):',
+            '        def helper():',
+            '            return self.b()',
+            '        return sorted([], key=lambda x: self.x)',
+        ]))
+
+        assert index.methods[0].vars == {'x'}
+        assert index.methods[0].calls == {'b'}
+
 
 class TestClassReflection(ReflectionTestCase):
     def setup_method(self):
         self.ref = self.module.class_by_name('tests.fixtures.Reflection')
 
+    def test_from_node(self):
+        node = ast.parse('class Foo:\n    def a(self):\n        pass\n')
+        ref = ClassReflection.from_node('foo', node.body[0])
+
+        assert ref.name() == 'foo.Foo'
+        assert [method.name() for method in ref.methods()] == ['foo.Foo::a']
+
     def test_list_variables(self):
         result = {var for var in self.ref.vars()}
         assert result == {
@@ -60,6 +218,25 @@ class TestClassReflection(ReflectionTestCase):
         expected = 'tests.fixtures.Reflection::get_x'
         assert self.ref.method_by_name('get_x').name() == expected
 
+    def test_method_by_name_returns_same_reflection(self):
+        ref = self.ref.method_by_name('get_x')
+
+        assert self.ref.method_by_name('get_x') is ref
+        assert ref in self.ref.methods()
+
+    def test_list_class_methods_in_definition_order(self):
+        result = [method.name() for method in self.ref.methods()]
+        assert result == [
+            'tests.fixtures.Reflection::decorated',
+            'tests.fixtures.Reflection::__init__',
+            'tests.fixtures.Reflection::get_x',
+            'tests.fixtures.Reflection::get_y',
+            'tests.fixtures.Reflection::methods',
+            'tests.fixtures.Reflection::vars',
+            'tests.fixtures.Reflection::consts',
+            'tests.fixtures.Reflection::loose',
+        ]
+
     def test_unknown_method_by_name(self):
         with raises(ReflectionError) as e:
             self.ref.method_by_name('foobar')
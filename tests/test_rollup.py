@@ -0,0 +1,85 @@
+from src.rollup import Histogram, Rollup, Summary
+
+
+class TestHistogram(object):
+    def test_counts_values_per_bucket(self):
+        histogram = Histogram((1, 2, 5))
+        for value in (0, 1, 1, 2, 4, 5, 10):
+            histogram.add(value)
+
+        assert histogram.counts() == [1, 2, 2, 2]
+
+    def test_labels(self):
+        assert Histogram((0, 0.5, 1)).labels() == [
+            '<0', '0-0.5', '0.5-1', '1+'
+        ]
+
+
+class TestSummary(object):
+    def test_empty(self):
+        summary = Summary(Rollup.INTEGERS)
+
+        assert summary.count() == 0
+        assert summary.average() == 0
+        assert summary.maximum() is None
+        assert summary.percentile(0.5) is None
+
+    def test_aggregates_values(self):
+        summary = Summary(Rollup.INTEGERS)
+        for value in (1, 1, 2, 4):
+            summary.add(value)
+
+        assert summary.count() == 4
+        assert summary.average() == 2.0
+        assert summary.minimum() == 1
+        assert summary.maximum() == 4
+
+    def test_percentiles_of_integer_scores_are_exact(self):
+        summary = Summary(Rollup.INTEGERS)
+        for value in range(1, 11):
+            summary.add(value % 5)
+
+        assert summary.percentile(0.5) == 2
+        assert summary.percentile(0.9) == 4
+
+    def test_percentiles_are_clipped_to_observed_range(self):
+        summary = Summary(Rollup.FRACTIONS)
+        for value in (0.25, 0.95):
+            summary.add(value)
+
+        assert summary.percentile(0.5) == 0.25
+        assert summary.percentile(0.9) == 0.9
+
+
+class TestRollup(object):
+    def test_rolls_up_modules_into_packages(self):
+        rollup = Rollup()
+        rollup.add('foo.bar', 1)
+        rollup.add('foo.bar', 3)
+        rollup.add('foo.baz', 2)
+        rollup.add('qux', 1)
+
+        assert [
+            (name, node.count(), node.average(), node.maximum())
+            for name, node in rollup.nodes()
+        ] == [
+            ('foo', 3, 2.0, 3),
+            ('foo.bar', 2, 2.0, 3),
+            ('foo.baz', 1, 2.0, 2),
+            ('qux', 1, 1.0, 1),
+        ]
+
+    def test_limits_depth(self):
+        rollup = Rollup(depth=1)
+        rollup.add('foo.bar.baz', 1)
+
+        assert [name for name, node in rollup.nodes()] == ['foo']
+
+    def test_uses_first_score_of_suite(self):
+        rollup = Rollup()
+        rollup.add('foo', (2, 0.5))
+
+        assert rollup.nodes()[0][1].maximum() == 2
+
+    def test_labels(self):
+        assert Rollup((1, 2)).labels() == ['<1', '1-2', '2+']
@@ -0,0 +1,235 @@
+import os
+import socket
+import threading
+
+from click.testing import CliRunner
+from pytest import mark, raises
+
+from src.command import ModuleScorer, main
+from src.lcom import LCOM4
+from src.server import Client, LRUCache, ScoreServer, ScoreService, \
+    ServerError
+
+SOURCE = '''
+class Foo(object):
+    def a(self):
+        return self.x
+
+    def b(self):
+        return self.y
+
+
+class Bar(object):
+    def a(self):
+        return self.x
+'''
+
+
+class CountingScorer(ModuleScorer):
+    def __init__(self, lcom):
+        super(CountingScorer, self).__init__(lcom)
+        self.scored = 0
+
+    def content(self, file, content):
+        self.scored += 1
+        return super(CountingScorer, self).content(file, content)
+
+
+class TestLRUCache(object):
+    def test_get_missing_entry(self):
+        assert LRUCache().get('foo') is None
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.set('foo', 1)
+        cache.set('bar', 2)
+        cache.get('foo')
+        cache.set('baz', 3)
+
+        assert cache.get('bar') is None
+        assert cache.get('foo') == 1
+        assert cache.get('baz') == 3
+        assert len(cache) == 2
+
+
+class TestScoreService(object):
+    def setup_method(self):
+        self.scorer = CountingScorer(LCOM4())
+        self.service = ScoreService(LCOM4(), self.scorer)
+
+    def query(self, tmpdir, **kwargs):
+        request = {'file': 'foo.py', 'cwd': str(tmpdir)}
+        request.update(kwargs)
+        return self.service.query(request)
+
+    def test_scores_file(self, tmpdir):
+        tmpdir.join('foo.py').write(SOURCE)
+
+        assert self.query(tmpdir) == {
+            'algorithm': 'LCOM4',
+            'scores': [['foo.Foo', 2], ['foo.Bar', 1]],
+        }
+
+    def test_scores_single_class(self, tmpdir):
+        tmpdir.join('foo.py').write(SOURCE)
+
+        assert self.query(tmpdir, **{'class': 'foo.Bar'})['scores'] == [
+            ['foo.Bar', 1]
+        ]
+
+    def test_reuses_scores_of_unmodified_file(self, tmpdir):
+        tmpdir.join('foo.py').write(SOURCE)
+
+        self.query(tmpdir)
+        self.query(tmpdir, **{'class': 'foo.Bar'})
+
+        assert self.scorer.scored == 1
+
+    def test_rescores_modified_file(self, tmpdir):
+        file = tmpdir.join('foo.py')
+        file.write(SOURCE)
+        self.query(tmpdir)
+
+        file.write('class Foo(object):\n    pass\n')
+        stat = os.stat(str(file))
+        os.utime(str(file), (stat.st_atime, stat.st_mtime + 10))
+
+        assert self.query(tmpdir)['scores'] == [['foo.Foo', 0]]
+        assert self.scorer.scored == 2
+
+    def test_reports_unknown_class(self, tmpdir):
+        tmpdir.join('foo.py').write(SOURCE)
+
+        assert self.query(tmpdir, **{'class': 'foo.Baz'}) == {
+            'error': 'Unknown class foo.Baz'
+        }
+
+    def test_reports_missing_file(self, tmpdir):
+        assert 'Unable to read foo.py' in self.query(tmpdir)['error']
+
+    def test_reports_syntax_error(self, tmpdir):
+        tmpdir.join('foo.py').write('class Foo(object:\n')
+
+        assert 'Unable to parse foo.py' in self.query(tmpdir)['error']
+
+    def test_reports_scoring_errors(self, tmpdir):
+        tmpdir.join('foo.py').write(SOURCE)
+
+        def fail(file, content):
+            raise ValueError('source code string cannot contain null bytes')
+        self.scorer.content = fail
+
+        assert self.query(tmpdir) == {
+            'error': 'Unable to score foo.py: ValueError: '
+                     'source code string cannot contain null bytes'
+        }
+
+    def test_reports_invalid_request(self):
+        assert self.service.query([]) == {'error': 'Invalid request'}
+
+
+@mark.skipif(not hasattr(socket, 'AF_UNIX'), reason='Requires Unix sockets')
+class TestScoreServer(object):
+    def setup_method(self):
+        self.thread = None
+        self.server = None
+
+    def teardown_method(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.thread.join()
+
+    def start(self, path):
+        self.server = ScoreServer(path, ScoreService(
+            LCOM4(), ModuleScorer(LCOM4())
+        ))
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def test_query(self, tmpdir):
+        tmpdir.join('foo.py').write(SOURCE)
+        path = str(tmpdir.join('lcom.sock'))
+        self.start(path)
+
+        client = Client(path)
+
+        assert client.query('foo.py', cwd=str(tmpdir)) == (
+            'LCOM4', [('foo.Foo', 2), ('foo.Bar', 1)]
+        )
+        assert client.query('foo.py', 'foo.Foo', str(tmpdir)) == (
+            'LCOM4', [('foo.Foo', 2)]
+        )
+
+    def test_query_class_from_many_files(self, tmpdir, monkeypatch):
+        tmpdir.join('foo.py').write(SOURCE)
+        tmpdir.join('bar.py').write(SOURCE)
+        path = str(tmpdir.join('lcom.sock'))
+        self.start(path)
+        monkeypatch.chdir(tmpdir)
+
+        def query(name):
+            return CliRunner().invoke(main, [
+                'query', '--socket', path, '--printer', 'csv',
+                '--class', name, 'foo.py', 'bar.py'
+            ])
+
+        assert query('bar.Foo').output.splitlines() == [
+            'name,algorithm,score',
+            'bar.Foo,LCOM4,2',
+            'Average,LCOM4,2.0',
+        ]
+        assert 'Unknown class bar.Baz' in query('bar.Baz').output
+        assert query('bar.Baz').exit_code == 1
+
+    def test_query_raises_server_errors(self, tmpdir):
+        path = str(tmpdir.join('lcom.sock'))
+        self.start(path)
+
+        with raises(ServerError) as e:
+            Client(path).query('foo.py', cwd=str(tmpdir))
+        assert 'Unable to read foo.py' in str(e.value)
+
+    def test_query_without_server(self, tmpdir):
+        with raises(ServerError):
+            Client(str(tmpdir.join('lcom.sock'))).query('foo.py')
+
+    def test_refuses_to_replace_regular_file(self, tmpdir):
+        file = tmpdir.join('notes.txt')
+        file.write('notes')
+
+        with raises(ServerError):
+            ScoreServer(str(file), ScoreService(
+                LCOM4(), ModuleScorer(LCOM4())
+            ))
+        assert file.read() == 'notes'
+
+    def test_refuses_to_take_over_running_server(self, tmpdir):
+        tmpdir.join('foo.py').write(SOURCE)
+        path = str(tmpdir.join('lcom.sock'))
+        self.start(path)
+
+        with raises(ServerError):
+            ScoreServer(path, ScoreService(LCOM4(), ModuleScorer(LCOM4())))
+        assert Client(path).query('foo.py', cwd=str(tmpdir))
+
+    def test_replaces_stale_socket(self, tmpdir):
+        path = str(tmpdir.join('lcom.sock'))
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(path)
+        stale.close()
+
+        server = ScoreServer(path, ScoreService(
+            LCOM4(), ModuleScorer(LCOM4())
+        ))
+        server.server_close()
+
+    def test_close_removes_socket(self, tmpdir):
+        path = str(tmpdir.join('lcom.sock'))
+        server = ScoreServer(path, ScoreService(
+            LCOM4(), ModuleScorer(LCOM4())
+        ))
+
+        assert os.path.exists(path)
+        server.server_close()
+        assert not os.path.exists(path)
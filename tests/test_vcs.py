@@ -0,0 +1,109 @@
+import os
+import subprocess
+
+from pytest import raises
+
+from src.vcs import Git, GitError
+
+
+class TestGit(object):
+    def setup_method(self):
+        self.env = dict(
+            os.environ,
+            GIT_AUTHOR_NAME='lcom',
+            GIT_AUTHOR_EMAIL='lcom@localhost',
+            GIT_COMMITTER_NAME='lcom',
+            GIT_COMMITTER_EMAIL='lcom@localhost',
+        )
+
+    def git(self, cwd, *args):
+        subprocess.check_call(
+            ('git',) + args,
+            cwd=cwd,
+            env=self.env,
+            stdout=subprocess.PIPE
+        )
+
+    def repository(self, tmpdir):
+        self.git(str(tmpdir), 'init', '-q')
+        tmpdir.join('pkg').mkdir()
+        for name in ('kept.py', 'changed.py', 'removed.py'):
+            tmpdir.join('pkg', name).write('class Foo: pass\n')
+        tmpdir.join('other.py').write('')
+        self.git(str(tmpdir), 'add', '.')
+        self.git(str(tmpdir), 'commit', '-q', '-m', 'initial')
+        return tmpdir
+
+    def test_lists_changed_and_untracked_files(self, tmpdir):
+        repo = self.repository(tmpdir)
+        repo.join('pkg', 'changed.py').write('class Bar: pass\n')
+        repo.join('pkg', 'removed.py').remove()
+        repo.join('pkg', 'new.py').write('')
+
+        result = Git(cwd=str(repo)).changed_files()
+
+        assert result == [
+            os.path.join('pkg', 'changed.py'),
+            os.path.join('pkg', 'new.py'),
+        ]
+
+    def test_lists_files_changed_since_revision(self, tmpdir):
+        repo = self.repository(tmpdir)
+        repo.join('pkg', 'changed.py').write('class Bar: pass\n')
+        self.git(str(repo), 'commit', '-q', '-a', '-m', 'change')
+
+        assert Git(cwd=str(repo)).changed_files() == []
+        assert Git(cwd=str(repo)).changed_files('HEAD~1') == [
+            os.path.join('pkg', 'changed.py'),
+        ]
+
+    def test_limits_files_to_paths(self, tmpdir):
+        repo = self.repository(tmpdir)
+        repo.join('pkg', 'changed.py').write('class Bar: pass\n')
+        repo.join('other.py').write('class Bar: pass\n')
+
+        result = Git(cwd=str(repo)).changed_files(paths=['pkg/'])
+
+        assert result == [os.path.join('pkg', 'changed.py')]
+
+    def test_lists_files_outside_current_directory(self, tmpdir):
+        repo = self.repository(tmpdir)
+        repo.join('pkg', 'changed.py').write('class Bar: pass\n')
+        repo.join('new.py').write('')
+
+        result = Git(cwd=str(repo.join('pkg'))).changed_files(paths=['..'])
+
+        assert result == [
+            os.path.join(os.pardir, 'new.py'),
+            'changed.py',
+        ]
+
+    def test_limits_files_to_absolute_paths(self, tmpdir):
+        repo = self.repository(tmpdir)
+        repo.join('pkg', 'changed.py').write('class Bar: pass\n')
+        repo.join('other.py').write('class Bar: pass\n')
+
+        result = Git(cwd=str(repo)).changed_files(
+            paths=[str(repo.join('pkg'))]
+        )
+
+        assert result == [os.path.join('pkg', 'changed.py')]
+
+    def test_lists_non_ascii_names(self, tmpdir):
+        repo = self.repository(tmpdir)
+        name = b'mod\xc3\xa9.py'.decode('utf-8')
+        repo.join('pkg', name).write('')
+
+        assert Git(cwd=str(repo)).changed_files() == [
+            os.path.join('pkg', name)
+        ]
+
+    def test_unknown_revision(self, tmpdir):
+        repo = self.repository(tmpdir)
+
+        with raises(GitError):
+            Git(cwd=str(repo)).changed_files('unknown')
+
+    def test_missing_executable(self, tmpdir):
+        with raises(GitError):
+            Git('lcom-missing-git', cwd=str(tmpdir)).changed_files()
@@ -0,0 +1,149 @@
+import os
+
+from pytest import fixture
+
+from src.command import FileSystem, ModuleScorer
+from src.lcom import LCOM4
+from src.watch import ScoreChange, Watcher
+
+SPLIT = '''
+class Foo(object):
+    def a(self):
+        return self.x
+
+    def b(self):
+        return self.y
+'''
+
+JOINED = '''
+class Foo(object):
+    def a(self):
+        return self.x
+
+    def b(self):
+        return self.x + self.y
+'''
+
+
+class CountingScorer(ModuleScorer):
+    def __init__(self, lcom):
+        super(CountingScorer, self).__init__(lcom)
+        self.scored = []
+
+    def content(self, file, content):
+        self.scored.append(os.path.basename(file))
+        return super(CountingScorer, self).content(file, content)
+
+
+class TestWatcher(object):
+    def setup_method(self):
+        self.scorer = CountingScorer(LCOM4())
+        self.watcher = Watcher(FileSystem(), self.scorer)
+
+    @fixture(autouse=True)
+    def chdir(self, tmpdir, monkeypatch):
+        monkeypatch.chdir(tmpdir)
+
+    def write(self, tmpdir, name, source):
+        file = tmpdir.join(name)
+        file.write(source)
+        stat = os.stat(str(file))
+        os.utime(str(file), (stat.st_atime, stat.st_mtime + 10))
+        return str(file)
+
+    def test_poll_scores_all_files(self, tmpdir):
+        self.write(tmpdir, 'foo.py', SPLIT)
+        self.write(tmpdir, 'bar.py', JOINED)
+
+        changes, errors = self.watcher.poll([os.curdir])
+
+        assert sorted(self.scorer.scored) == ['bar.py', 'foo.py']
+        assert sorted(changes) == [
+            ScoreChange('bar.Foo', None, 1),
+            ScoreChange('foo.Foo', None, 2),
+        ]
+        assert errors == []
+
+    def test_poll_skips_unmodified_files(self, tmpdir):
+        self.write(tmpdir, 'foo.py', SPLIT)
+        self.watcher.poll([os.curdir])
+
+        changes, errors = self.watcher.poll([os.curdir])
+
+        assert self.scorer.scored == ['foo.py']
+        assert changes == []
+
+    def test_poll_skips_touched_files_with_same_content(self, tmpdir):
+        file = self.write(tmpdir, 'foo.py', SPLIT)
+        self.watcher.poll([os.curdir])
+        os.utime(file, (0, 0))
+
+        changes, errors = self.watcher.poll([os.curdir])
+
+        assert self.scorer.scored == ['foo.py']
+        assert changes == []
+
+    def test_poll_rescores_modified_files(self, tmpdir):
+        self.write(tmpdir, 'foo.py', SPLIT)
+        self.write(tmpdir, 'bar.py', SPLIT)
+        self.watcher.poll([os.curdir])
+        self.scorer.scored = []
+
+        self.write(tmpdir, 'foo.py', JOINED)
+        changes, errors = self.watcher.poll([os.curdir])
+
+        assert self.scorer.scored == ['foo.py']
+        assert changes == [ScoreChange('foo.Foo', 2, 1)]
+        assert sorted(self.watcher.scores()) == [
+            ('bar.Foo', 2),
+            ('foo.Foo', 1),
+        ]
+
+    def test_poll_reports_removed_files(self, tmpdir):
+        file = self.write(tmpdir, 'foo.py', SPLIT)
+        self.watcher.poll([os.curdir])
+        os.remove(file)
+
+        changes, errors = self.watcher.poll([os.curdir])
+
+        assert changes == [ScoreChange('foo.Foo', 2, None)]
+        assert self.watcher.scores() == []
+
+    def test_poll_keeps_scores_of_files_with_syntax_errors(self, tmpdir):
+        self.write(tmpdir, 'foo.py', SPLIT)
+        self.watcher.poll([os.curdir])
+
+        self.write(tmpdir, 'foo.py', 'class Foo(object:\n')
+        changes, errors = self.watcher.poll([os.curdir])
+
+        assert changes == []
+        assert [os.path.basename(elem[0]) for elem in errors] == ['foo.py']
+        assert self.watcher.scores() == [('foo.Foo', 2)]
+
+    def test_poll_keeps_scores_of_files_skipped_by_scorer(self, tmpdir):
+        watcher = Watcher(FileSystem(), ModuleScorer(LCOM4(), isolate=True))
+        self.write(tmpdir, 'foo.py', SPLIT)
+        watcher.poll([os.curdir])
+
+        self.write(tmpdir, 'foo.py', 'class Foo(object:\n')
+        changes, errors = watcher.poll([os.curdir])
+
+        assert changes == []
+        assert [os.path.basename(elem[0]) for elem in errors] == ['foo.py']
+        assert watcher.scores() == [('foo.Foo', 2)]
+
+    def test_poll_forgets_digest_of_broken_files(self, tmpdir):
+        self.write(tmpdir, 'foo.py', SPLIT)
+        self.watcher.poll([os.curdir])
+        self.write(tmpdir, 'foo.py', 'class Foo(object:\n')
+        self.watcher.poll([os.curdir])
+        self.scorer.scored = []
+
+        watcher = Watcher(FileSystem(), self.scorer, [
+            (file, elem._replace(stamp=None))
+            for file, elem in self.watcher.files()
+        ])
+        changes, errors = watcher.poll([os.curdir])
+
+        assert self.scorer.scored == ['foo.py']
+        assert [os.path.basename(elem[0]) for elem in errors] == ['foo.py']